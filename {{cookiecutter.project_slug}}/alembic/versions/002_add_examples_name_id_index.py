@@ -0,0 +1,47 @@
+{% if cookiecutter.use_postgresql == "yes" -%}
+"""Add composite (name, id) index on examples
+
+Revision ID: 002_examples_name_id
+Revises: {% if cookiecutter.include_auth == "yes" %}001_create_users{% else %}000_create_examples{% endif %}
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '002_examples_name_id'
+down_revision = {% if cookiecutter.include_auth == "yes" %}'001_create_users'{% else %}'000_create_examples'{% endif %}
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create index backing keyset pagination sorted by name."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_examples_name_id',
+            'examples',
+            ['name', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the (name, id) index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_examples_name_id',
+            table_name='examples',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+{% else -%}
+"""Migration placeholder - PostgreSQL not enabled."""
+
+# Migration disabled in this configuration
+# To enable, regenerate with use_postgresql=yes
+{% endif -%}
@@ -0,0 +1,58 @@
+{% if cookiecutter.use_postgresql == "yes" -%}
+"""Add trigram indexes for example substring filters
+
+Revision ID: 003_examples_trigram
+Revises: 002_examples_name_id
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003_examples_trigram'
+down_revision = '002_examples_name_id'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = {
+    'ix_examples_name_trgm': 'name',
+    'ix_examples_description_trgm': 'description',
+}
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and build GIN trigram indexes without locking writes."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name, column in TRIGRAM_INDEXES.items():
+            op.create_index(
+                index_name,
+                'examples',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the extension is left installed)."""
+    with op.get_context().autocommit_block():
+        for index_name in TRIGRAM_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name='examples',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+{% else -%}
+"""Migration placeholder - PostgreSQL not enabled."""
+
+# Migration disabled in this configuration
+# To enable, regenerate with use_postgresql=yes
+{% endif -%}
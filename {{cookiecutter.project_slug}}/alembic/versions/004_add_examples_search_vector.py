@@ -0,0 +1,98 @@
+{% if cookiecutter.use_postgresql == "yes" -%}
+"""Add trigger-maintained full-text search vector to examples
+
+Revision ID: 004_examples_search_vector
+Revises: 003_examples_trigram
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '004_examples_search_vector'
+down_revision = '003_examples_trigram'
+branch_labels = None
+depends_on = None
+
+# Rows updated per backfill statement, each committed on its own
+BACKFILL_BATCH_SIZE = 5000
+
+# Kept in sync with app.models.example.SEARCH_VECTOR_EXPRESSION; {row} is
+# "NEW." inside the trigger and empty in the backfill
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce({row}name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Add the search vector column online: trigger, batched backfill, concurrent index."""
+    # A nullable column without default only changes the catalog, so the
+    # ACCESS EXCLUSIVE lock is brief (a stored generated column would
+    # rewrite the whole table under it)
+    op.add_column('examples', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Rows written from now on get their vector from the trigger
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION examples_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_EXPRESSION.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER examples_search_vector_update
+        BEFORE INSERT OR UPDATE OF name, description ON examples
+        FOR EACH ROW EXECUTE FUNCTION examples_search_vector_update()
+        """
+    )
+
+    # Outside the migration's transaction, so every batch commits and only
+    # holds its own rows' locks
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        max_id = connection.execute(sa.text('SELECT max(id) FROM examples')).scalar() or 0
+        backfill = sa.text(
+            f"UPDATE examples SET search_vector = {SEARCH_VECTOR_EXPRESSION.format(row='')} "
+            "WHERE id > :start AND id <= :end AND search_vector IS NULL"
+        )
+        for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+            connection.execute(backfill, {'start': start, 'end': start + BACKFILL_BATCH_SIZE})
+
+        # CONCURRENTLY cannot run inside a transaction block
+        op.create_index(
+            'ix_examples_search_vector',
+            'examples',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the search index, trigger and column."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_examples_search_vector',
+            table_name='examples',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute('DROP TRIGGER IF EXISTS examples_search_vector_update ON examples')
+    op.execute('DROP FUNCTION IF EXISTS examples_search_vector_update()')
+    op.drop_column('examples', 'search_vector')
+{% else -%}
+"""Migration placeholder - PostgreSQL not enabled."""
+
+# Migration disabled in this configuration
+# To enable, regenerate with use_postgresql=yes
+{% endif -%}
@@ -0,0 +1,48 @@
+{% if cookiecutter.use_postgresql == "yes" -%}
+"""Add row version and modification time to examples
+
+Revision ID: 005_examples_version
+Revises: 004_examples_search_vector
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_examples_version'
+down_revision = '004_examples_search_vector'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the version and updated_at columns used for ETags."""
+    # Constant and now() defaults are evaluated once, so neither column
+    # rewrites the table (PostgreSQL 11+)
+    op.add_column(
+        'examples',
+        sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False),
+    )
+    op.add_column(
+        'examples',
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the version and updated_at columns."""
+    op.drop_column('examples', 'updated_at')
+    op.drop_column('examples', 'version')
+{% else -%}
+"""Migration placeholder - PostgreSQL not enabled."""
+
+# Migration disabled in this configuration
+# To enable, regenerate with use_postgresql=yes
+{% endif -%}
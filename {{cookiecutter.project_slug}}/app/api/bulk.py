@@ -0,0 +1,155 @@
+"""Bulk request body parsing shared by the batch endpoints."""
+
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+import msgpack
+from fastapi import HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.api.negotiation import MSGPACK_MEDIA_TYPES, media_type_of
+from app.core.config import settings
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def _too_large(detail: str) -> HTTPException:
+    """Build the error raised when a bulk body exceeds its ceiling."""
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+
+async def _stream_body(request: Request) -> AsyncIterator[bytes]:
+    """Stream the request body, stopping once it exceeds BULK_MAX_BODY_BYTES."""
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > settings.BULK_MAX_BODY_BYTES:
+        raise _too_large(f"Request body exceeds {settings.BULK_MAX_BODY_BYTES} bytes")
+
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > settings.BULK_MAX_BODY_BYTES:
+            raise _too_large(f"Request body exceeds {settings.BULK_MAX_BODY_BYTES} bytes")
+        yield chunk
+
+
+async def _read_body(request: Request) -> bytes:
+    """Read the request body, refusing to buffer more than BULK_MAX_BODY_BYTES."""
+    body = bytearray()
+    async for chunk in _stream_body(request):
+        body.extend(chunk)
+    return bytes(body)
+
+
+async def _read_ndjson(request: Request) -> list[Any]:
+    """
+    Parse an NDJSON body line by line.
+
+    Stops as soon as BULK_MAX_ITEMS or BULK_MAX_BODY_BYTES is exceeded, and
+    never buffers a line longer than BULK_MAX_LINE_BYTES.
+    """
+    items: list[Any] = []
+    pending = b""
+    line_no = 0
+
+    def parse(line: bytes) -> None:
+        nonlocal line_no
+        line_no += 1
+        if len(line) > settings.BULK_MAX_LINE_BYTES:
+            raise _too_large(f"Line {line_no} exceeds {settings.BULK_MAX_LINE_BYTES} bytes")
+        if not line.strip():
+            return
+        try:
+            items.append(json.loads(line))
+        except ValueError as exc:
+            raise RequestValidationError(
+                [{"type": "json_invalid", "loc": ("body", line_no), "msg": str(exc), "input": None}]
+            ) from exc
+        if len(items) > settings.BULK_MAX_ITEMS:
+            raise _too_large(f"At most {settings.BULK_MAX_ITEMS} items per request")
+
+    async for chunk in _stream_body(request):
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            parse(line)
+        if len(pending) > settings.BULK_MAX_LINE_BYTES:
+            raise _too_large(f"Line {line_no + 1} exceeds {settings.BULK_MAX_LINE_BYTES} bytes")
+    parse(pending)
+    return items
+
+
+async def _read_msgpack(request: Request) -> Any:
+    """Decode a MessagePack body, reporting malformed input like invalid JSON."""
+    try:
+        return msgpack.unpackb(await _read_body(request))
+    except ValueError as exc:
+        raise RequestValidationError(
+            [{"type": "msgpack_invalid", "loc": ("body",), "msg": str(exc), "input": None}]
+        ) from exc
+
+
+def bulk_body(model: type[ModelT]) -> Callable[[Request], Awaitable[list[ModelT]]]:
+    """
+    Create a dependency that parses a list of ``model`` from the request body.
+
+    The body may be a JSON array (``application/json``), one JSON object per
+    line (``application/x-ndjson``) or a MessagePack array
+    (``application/msgpack``). All items are validated in a single pass;
+    errors are reported like FastAPI's own, located by item index.
+
+    Args:
+        model: Pydantic model of a single item
+
+    Returns:
+        FastAPI dependency returning the validated items
+
+    Raises:
+        HTTPException: 413 if the body exceeds BULK_MAX_BODY_BYTES or
+            BULK_MAX_ITEMS (or an NDJSON line BULK_MAX_LINE_BYTES), 415 for
+            unsupported content types
+        RequestValidationError: If any item is invalid
+    """
+    adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+
+    async def dependency(request: Request) -> list[ModelT]:
+        media_type = media_type_of(request.headers.get("content-type", JSON_MEDIA_TYPE))
+
+        try:
+            if media_type in NDJSON_MEDIA_TYPES:
+                items = adapter.validate_python(await _read_ndjson(request))
+            elif media_type == JSON_MEDIA_TYPE:
+                items = adapter.validate_json(await _read_body(request))
+            elif media_type in MSGPACK_MEDIA_TYPES:
+                items = adapter.validate_python(await _read_msgpack(request))
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail=f"Unsupported content type {media_type!r}",
+                )
+        except ValidationError as exc:
+            errors = exc.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("body", *error["loc"])
+            raise RequestValidationError(errors) from exc
+
+        if len(items) > settings.BULK_MAX_ITEMS:
+            raise _too_large(f"At most {settings.BULK_MAX_ITEMS} items per request")
+        return items
+
+    return dependency
+
+
+def bulk_openapi(schema_name: str) -> dict[str, Any]:
+    """OpenAPI request body for routes reading their body through :func:`bulk_body`."""
+    items = {"$ref": f"#/components/schemas/{schema_name}"}
+    content = {
+        JSON_MEDIA_TYPE: {"schema": {"type": "array", "items": items}},
+        NDJSON_MEDIA_TYPES[0]: {"schema": items},
+        MSGPACK_MEDIA_TYPES[0]: {"schema": {"type": "array", "items": items}},
+    }
+    return {"requestBody": {"required": True, "content": content}}
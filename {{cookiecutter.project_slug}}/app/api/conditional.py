@@ -0,0 +1,91 @@
+"""Conditional GET support: ETag / Last-Modified validators and 304 responses.
+
+Read routes derive a strong ETag from the row versions (and query options)
+a representation is built from, so a client revalidating with
+``If-None-Match`` gets a bodiless 304 before any response model is built or
+serialized.
+"""
+
+import hashlib
+from datetime import datetime
+from email.utils import formatdate, mktime_tz, parsedate_tz
+from typing import Any, TypeVar
+
+from fastapi import Request, Response, status
+
+from app.api.negotiation import response_msgpack
+
+ResultT = TypeVar("ResultT")
+
+
+def etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values a representation is derived from.
+
+    The negotiated encoding is part of the tag, since the JSON and MessagePack
+    bodies of the same resource differ byte for byte.
+    """
+    encoding = "msgpack" if response_msgpack.get() else "json"
+    digest = hashlib.blake2b(repr((encoding, parts)).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def validator_headers(tag: str, last_modified: datetime | None = None) -> dict[str, str]:
+    """Return the ETag (and Last-Modified) headers for a representation."""
+    headers = {"ETag": tag}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified.timestamp(), usegmt=True)
+    return headers
+
+
+def _matches(if_none_match: str, tag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``tag``."""
+    if if_none_match.strip() == "*":
+        return True
+    # Compression may have weakened tags we handed out (W/"..."), so compare opaque parts
+    opaque = tag.removeprefix("W/")
+    candidates = (candidate.strip().removeprefix("W/") for candidate in if_none_match.split(","))
+    return opaque in candidates
+
+
+def is_not_modified(request: Request, tag: str, last_modified: datetime | None = None) -> bool:
+    """
+    Whether the client's cached copy is still current.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only checked
+    when it is absent and the resource has a modification time.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _matches(if_none_match, tag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    since = parsedate_tz(if_modified_since)
+    if since is None:
+        return False
+    # HTTP dates have one-second resolution
+    return int(last_modified.timestamp()) <= mktime_tz(since)
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """Build a 304 response carrying the representation's validators."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "Vary": "Accept"})
+
+
+def with_headers(result: ResultT, response: Response, headers: dict[str, str]) -> ResultT:
+    """
+    Attach ``headers`` to a route's result.
+
+    Args:
+        result: What the route returns, a model or an already built response
+        response: The route's injected ``Response``, whose headers FastAPI
+            copies onto the response it builds from a model
+
+    Returns:
+        ``result`` unchanged
+    """
+    target = result if isinstance(result, Response) else response
+    target.headers.update(headers)
+    return result
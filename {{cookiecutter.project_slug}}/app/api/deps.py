@@ -18,10 +18,32 @@ import json
 from typing import Any
 
 import redis
+import redis.asyncio as aioredis
 from app.core.config import settings
 
-# Redis client for caching
-redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+# Synchronous Redis client, for code outside the event loop (tasks, scripts);
+# bounded waits so an unresponsive Redis fails calls instead of hanging them
+redis_client = redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+)
+
+# Asyncio Redis client for async routes, so cache round trips do not block the
+# event loop. The pool is capped: callers wait up to REDIS_POOL_TIMEOUT for a
+# free connection rather than opening one per concurrent request.
+async_redis_client = aioredis.Redis(
+    connection_pool=aioredis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        decode_responses=True,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    )
+)
 
 
 def get_redis() -> redis.Redis:
@@ -29,6 +51,11 @@ def get_redis() -> redis.Redis:
     return redis_client
 
 
+def get_async_redis() -> aioredis.Redis:
+    """Dependency for the asyncio Redis client."""
+    return async_redis_client
+
+
 def get_cache(key: str) -> Any | None:
     """
     Get value from cache.
@@ -57,6 +84,62 @@ def set_cache(key: str, value: Any, ttl: int = 3600) -> None:
     redis_client.setex(key, ttl, json.dumps(value))
 
 
+def get_cache_many(keys: list[str]) -> list[Any | None]:
+    """
+    Get many values from cache with a single MGET.
+
+    Args:
+        keys: Cache keys
+
+    Returns:
+        Cached values (None for misses) in the order of ``keys``; all misses
+        if Redis is unavailable
+    """
+    if not keys:
+        return []
+    try:
+        values = redis_client.mget(keys)
+    except redis.RedisError:
+        return [None] * len(keys)
+    return [json.loads(value) if value else None for value in values]
+
+
+def set_cache_many(values: dict[str, Any], ttl: int = 3600) -> None:
+    """
+    Set many values in cache with TTL in one pipelined round trip.
+
+    Errors are ignored so a Redis outage only costs cache hits.
+
+    Args:
+        values: Mapping of cache key to value (will be JSON serialized)
+        ttl: Time to live in seconds (default: 1 hour)
+    """
+    if not values:
+        return
+    pipeline = redis_client.pipeline(transaction=False)
+    for key, value in values.items():
+        pipeline.setex(key, ttl, json.dumps(value))
+    try:
+        pipeline.execute()
+    except redis.RedisError:
+        pass
+
+
+def delete_cache_keys(*keys: str) -> None:
+    """
+    Delete exact cache keys with a single DEL.
+
+    Args:
+        keys: Cache keys to delete
+    """
+    if not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError:
+        pass
+
+
 def delete_cache(pattern: str) -> None:
     """
     Delete cache keys matching pattern.
@@ -66,6 +149,65 @@ def delete_cache(pattern: str) -> None:
     """
     for key in redis_client.scan_iter(pattern):
         redis_client.delete(key)
+
+
+async def get_cache_async(key: str) -> Any | None:
+    """Get value from cache without blocking the event loop (see :func:`get_cache`)."""
+    cached = await async_redis_client.get(key)
+    if cached:
+        return json.loads(cached)
+    return None
+
+
+async def set_cache_async(key: str, value: Any, ttl: int = 3600) -> None:
+    """Set value in cache with TTL without blocking the event loop (see :func:`set_cache`)."""
+    await async_redis_client.setex(key, ttl, json.dumps(value))
+
+
+async def get_cache_many_async(keys: list[str]) -> list[Any | None]:
+    """
+    Get many values from cache with a single MGET (see :func:`get_cache_many`).
+
+    Returns:
+        Cached values (None for misses) in the order of ``keys``; all misses
+        if Redis is unavailable
+    """
+    if not keys:
+        return []
+    try:
+        values = await async_redis_client.mget(keys)
+    except redis.RedisError:
+        return [None] * len(keys)
+    return [json.loads(value) if value else None for value in values]
+
+
+async def set_cache_many_async(values: dict[str, Any], ttl: int = 3600) -> None:
+    """Set many values in cache in one pipelined round trip, ignoring errors (see :func:`set_cache_many`)."""
+    if not values:
+        return
+    pipeline = async_redis_client.pipeline(transaction=False)
+    for key, value in values.items():
+        pipeline.setex(key, ttl, json.dumps(value))
+    try:
+        await pipeline.execute()
+    except redis.RedisError:
+        pass
+
+
+async def delete_cache_keys_async(*keys: str) -> None:
+    """Delete exact cache keys with a single DEL, ignoring errors (see :func:`delete_cache_keys`)."""
+    if not keys:
+        return
+    try:
+        await async_redis_client.delete(*keys)
+    except redis.RedisError:
+        pass
+
+
+async def delete_cache_async(pattern: str) -> None:
+    """Delete cache keys matching pattern without blocking the event loop (see :func:`delete_cache`)."""
+    async for key in async_redis_client.scan_iter(pattern):
+        await async_redis_client.delete(key)
 {% else -%}
 # Redis dependencies disabled - Redis not enabled
 {% endif %}
@@ -73,7 +215,6 @@ def delete_cache(pattern: str) -> None:
 {% if cookiecutter.include_auth == "yes" -%}
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 
 from app.core.config import settings
 
@@ -82,6 +223,9 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict[str, Any]:
     """Get current authenticated user from JWT token."""
+    # Imported on first use to keep python-jose out of application startup
+    from jose import JWTError, jwt
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -0,0 +1,114 @@
+"""Row encoders for the streaming export endpoints.
+
+pyarrow is only imported once an Arrow export starts, keeping it out of
+application start-up.
+"""
+
+import csv
+import importlib.util
+import io
+import json
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+def encode_ndjson(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> bytes:
+    """
+    Encode rows as newline-delimited JSON, one object per row.
+
+    Args:
+        columns: Column names, used as object keys
+        rows: Row values in column order
+
+    Returns:
+        UTF-8 encoded NDJSON, ending with a newline unless there are no rows
+    """
+    lines = [json.dumps(dict(zip(columns, row, strict=True)), default=str) for row in rows]
+    return "".join(f"{line}\n" for line in lines).encode()
+
+
+def encode_csv(
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    *,
+    header: bool = False,
+) -> bytes:
+    """
+    Encode rows as CSV (RFC 4180 quoting, ``\\r\\n`` line endings).
+
+    Args:
+        columns: Column names, written as the header row
+        rows: Row values in column order; None becomes an empty field
+        header: Whether to start with the header row
+
+    Returns:
+        UTF-8 encoded CSV
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def arrow_available() -> bool:
+    """Whether the optional pyarrow dependency is installed (``arrow`` extra)."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+class ArrowStreamEncoder:
+    """
+    Incremental encoder for the Arrow IPC streaming format.
+
+    Each chunk of rows becomes one record batch, built column by column, so
+    consumers can read the stream with ``pyarrow.ipc.open_stream`` (or any
+    Arrow implementation) without parsing. Requires pyarrow.
+    """
+
+    def __init__(self, columns: Sequence[tuple[str, str]]) -> None:
+        """
+        Start a stream.
+
+        Args:
+            columns: (name, Arrow type alias) pairs, e.g. ``("id", "int64")``
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("Arrow export requires pyarrow (install the 'arrow' extra)") from exc
+        self._pa = pa
+        self.schema = pa.schema([(name, pa.type_for_alias(alias)) for name, alias in columns])
+        self._buffer = io.BytesIO()
+        self._writer = pa.ipc.new_stream(pa.PythonFile(self._buffer, mode="w"), self.schema)
+
+    def _drain(self) -> bytes:
+        """Return and forget everything written so far."""
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Encode one chunk of rows as a record batch (the schema precedes the first one)."""
+        if not rows:
+            return b""
+        pa = self._pa
+        values = list(zip(*rows, strict=True))
+        arrays = [
+            pa.array(column, type=field.type)
+            for column, field in zip(values, self.schema, strict=True)
+        ]
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        return self._drain()
+
+    def close(self) -> bytes:
+        """Finish the stream, returning the remaining bytes (schema if no rows, end marker)."""
+        self._writer.close()
+        return self._drain()
@@ -0,0 +1,94 @@
+"""Sparse fieldsets (``?fields=``) shared by the read endpoints."""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from fastapi import HTTPException, Query, Response, status
+from pydantic import BaseModel, create_model
+
+from app.api.negotiation import MSGPACK_MEDIA_TYPE, packb, response_msgpack
+
+Fields = tuple[str, ...]
+
+
+def sparse_fields(
+    model: type[BaseModel],
+    *,
+    always: Fields = ("id",),
+) -> Callable[..., Fields | None]:
+    """
+    Create a dependency that parses a ``fields`` query parameter.
+
+    The parameter is a comma-separated subset of ``model``'s fields, e.g.
+    ``?fields=id,name``. Fields in ``always`` are included even when not
+    requested, so clients can still identify the items.
+
+    Args:
+        model: Pydantic model whose fields may be selected
+        always: Fields that are always returned
+
+    Returns:
+        FastAPI dependency returning the selected field names in model order,
+        or None when the parameter is absent (all fields)
+
+    Raises:
+        HTTPException: 400 if an unknown field is requested
+    """
+    allowed = tuple(model.model_fields)
+
+    def dependency(
+        fields: str | None = Query(
+            None,
+            description=f"Comma-separated subset of: {', '.join(allowed)}",
+        ),
+    ) -> Fields | None:
+        if fields is None:
+            return None
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = sorted(requested - set(allowed))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+        selected = requested | set(always)
+        return tuple(field for field in allowed if field in selected)
+
+    return dependency
+
+
+@lru_cache(maxsize=128)
+def partial_model(model: type[BaseModel], fields: Fields | None) -> type[BaseModel]:
+    """
+    Build (once per field set) a copy of ``model`` restricted to ``fields``.
+
+    Field definitions, validation and config (e.g. ``from_attributes``) are
+    carried over from ``model``. Returns ``model`` itself when ``fields`` is None.
+    """
+    if fields is None:
+        return model
+    definitions: dict[str, Any] = {
+        name: (info.annotation, info) for name, info in model.model_fields.items() if name in fields
+    }
+    return create_model(
+        f"{model.__name__}[{','.join(fields)}]",
+        __config__=model.model_config,
+        **definitions,
+    )
+
+
+def json_response(payload: BaseModel) -> Response:
+    """
+    Serialize a model directly into a JSON (or negotiated MessagePack) response.
+
+    Used for partial results, which do not match the route's response_model.
+    The body depends on the Accept header, so the response varies on it.
+    """
+    headers = {"Vary": "Accept"}
+    if response_msgpack.get():
+        content = packb(payload.model_dump(mode="json"))
+        return Response(content=content, media_type=MSGPACK_MEDIA_TYPE, headers=headers)
+    return Response(
+        content=payload.model_dump_json(), media_type="application/json", headers=headers
+    )
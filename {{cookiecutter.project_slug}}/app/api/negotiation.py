@@ -0,0 +1,112 @@
+"""MessagePack content negotiation for the API routers.
+
+Routers created with ``route_class=NegotiatedRoute`` answer in MessagePack
+when the client prefers it (``Accept: application/msgpack``) and accept
+MessagePack request bodies (``Content-Type: application/msgpack``). The same
+schemas validate and document both encodings; JSON stays the default.
+"""
+
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
+from typing import Any
+
+import msgpack
+import orjson
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+# Whether the response being rendered for the current request should be MessagePack
+response_msgpack: ContextVar[bool] = ContextVar("response_msgpack", default=False)
+
+
+def media_type_of(content_type: str | None) -> str:
+    """Return the bare, lower-cased media type of a Content-Type header."""
+    return (content_type or "").split(";")[0].strip().lower()
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """
+    Whether an Accept header prefers MessagePack over JSON.
+
+    MessagePack wins when it has a non-zero quality at least as high as that
+    of ``application/json`` (or of the wildcards standing in for it).
+    """
+    if not accept:
+        return False
+
+    msgpack_q = 0.0
+    json_q = 0.0
+    for part in accept.split(","):
+        media_type, *params = part.split(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, quality)
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json_q = max(json_q, quality)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def packb(content: Any) -> bytes:
+    """Encode content as MessagePack, writing values it has no type for as strings."""
+    return msgpack.packb(content, default=str)  # type: ignore[no-any-return]
+
+
+async def _with_json_body(request: Request) -> Request:
+    """Return a copy of ``request`` whose MessagePack body has been re-encoded as JSON."""
+    try:
+        body = orjson.dumps(msgpack.unpackb(await request.body()), option=orjson.OPT_NON_STR_KEYS)
+    except (ValueError, TypeError) as exc:
+        # Malformed MessagePack, or values with no JSON equivalent (e.g. binary)
+        raise RequestValidationError(
+            [{"type": "msgpack_invalid", "loc": ("body",), "msg": str(exc), "input": None}]
+        ) from exc
+
+    headers = [
+        (name, value)
+        for name, value in request.scope["headers"]
+        if name not in (b"content-type", b"content-length")
+    ]
+    scope = {**request.scope, "headers": [*headers, (b"content-type", b"application/json")]}
+    json_request = Request(scope, request.receive)
+    json_request._body = body
+    return json_request
+
+
+class NegotiatedRoute(APIRoute):
+    """
+    API route that negotiates MessagePack for request and response bodies.
+
+    Response bodies are rendered by :class:`app.api.responses.NegotiatedResponse`,
+    which reads the preference recorded here. Request bodies declared as route
+    parameters are decoded before FastAPI parses them; bodies read by
+    dependencies (see :func:`app.api.bulk.bulk_body`) are left to those.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        decodes_body = self.body_field is not None
+
+        async def negotiated_handler(request: Request) -> Response:
+            content_type = media_type_of(request.headers.get("content-type"))
+            if decodes_body and content_type in MSGPACK_MEDIA_TYPES:
+                request = await _with_json_body(request)
+
+            token = response_msgpack.set(prefers_msgpack(request.headers.get("accept")))
+            try:
+                return await handler(request)
+            finally:
+                response_msgpack.reset(token)
+
+        return negotiated_handler
@@ -0,0 +1,237 @@
+"""Per-principal, per-route rate limiting.
+
+Routes opt in with a dependency built by :func:`rate_limit`. Every
+(principal, route) pair gets a token bucket holding ``limit`` tokens that
+refills over ``period`` seconds, so clients may burst up to the limit but
+not exceed it on average. {% if cookiecutter.include_auth == "yes" %}The principal is the subject of the caller's access
+token when it is valid, and their address otherwise, so made-up tokens
+share their sender's bucket.{% else %}The principal is the caller's address.{% endif %}
+{% if cookiecutter.use_redis == "yes" %}
+Buckets live in Redis and are updated by a single atomic Lua script, so a
+limit holds across all workers. When Redis errors, or does not answer within
+``RATE_LIMIT_REDIS_BUDGET_MS``, the limiter switches to in-process buckets
+for ``RATE_LIMIT_FALLBACK_SECONDS``: limits are then enforced per worker
+(approximately, and more leniently), but no request waits on Redis.
+{% else %}
+Without Redis the buckets are kept in process, so limits are enforced per
+worker.
+{% endif -%}
+"""
+
+{% if cookiecutter.use_redis == "yes" -%}
+import asyncio
+{% endif -%}
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+{% if cookiecutter.use_redis == "yes" -%}
+import redis
+import redis.asyncio as aioredis
+{% endif -%}
+from fastapi import HTTPException, Request, Response, status
+
+{% if cookiecutter.use_redis == "yes" -%}
+from app.api.deps import async_redis_client
+{% endif -%}
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class Decision:
+    """Outcome of taking a token from a bucket."""
+
+    allowed: bool
+    remaining: int
+    # Seconds until a token is available again (0 when allowed)
+    retry_after: float
+
+
+class LocalTokenBuckets:
+    """
+    In-process token buckets, bounded to the most recently used keys.
+
+    Args:
+        max_keys: Buckets kept; the least recently used are forgotten (refilled)
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def hit(self, key: str, limit: int, period: float) -> Decision:
+        """Take one token from ``key``'s bucket."""
+        now = time.monotonic()
+        rate = limit / period
+        tokens, updated = self._buckets.pop(key, (float(limit), now))
+        tokens = min(float(limit), tokens + (now - updated) * rate)
+        if tokens >= 1:
+            decision = Decision(allowed=True, remaining=int(tokens - 1), retry_after=0)
+            tokens -= 1
+        else:
+            decision = Decision(allowed=False, remaining=0, retry_after=(1 - tokens) / rate)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return decision
+{% if cookiecutter.use_redis == "yes" %}
+
+# Token bucket update, atomic on the server. Uses the server clock so workers
+# with skewed clocks agree. Returns {allowed, tokens left, seconds to wait}.
+TOKEN_BUCKET_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local rate = limit / period
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or limit
+local updated = tonumber(state[2]) or now
+tokens = math.min(limit, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(period * 1000))
+return {allowed, tostring(tokens), tostring(wait)}
+"""
+
+
+class RedisTokenBuckets:
+    """
+    Token buckets shared by all workers through Redis.
+
+    Args:
+        client: Redis client to run the script on
+    """
+
+    def __init__(self, client: aioredis.Redis) -> None:
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def hit(self, key: str, limit: int, period: float) -> Decision:
+        """Take one token from ``key``'s bucket (raises ``redis.RedisError``)."""
+        allowed, tokens, wait = await self._script(keys=[f"ratelimit:{key}"], args=[limit, period])
+        return Decision(
+            allowed=bool(allowed),
+            remaining=int(float(tokens)),
+            retry_after=float(wait),
+        )
+{% endif %}
+
+class RateLimiter:
+    """
+    Token buckets in Redis when available, in process otherwise.
+
+    Args:
+        local: In-process buckets, also used while Redis is degraded{% if cookiecutter.use_redis == "yes" %}
+        remote: Shared Redis buckets, or None to only limit in process
+        budget: Seconds a Redis call may take before it is abandoned and Redis
+            counts as degraded
+        fallback: Seconds to stay on the local buckets once Redis is degraded{% endif %}
+    """
+
+    def __init__(
+        self,
+        local: LocalTokenBuckets,{% if cookiecutter.use_redis == "yes" %}
+        remote: RedisTokenBuckets | None = None,
+        budget: float = 0.05,
+        fallback: float = 30,{% endif %}
+    ) -> None:
+        self.local = local{% if cookiecutter.use_redis == "yes" %}
+        self.remote = remote
+        self.budget = budget
+        self.fallback = fallback
+        # Until when (monotonic) requests skip Redis
+        self.degraded_until = 0.0{% endif %}
+
+    async def hit(self, key: str, limit: int, period: float) -> Decision:
+        """Take one token from ``key``'s bucket."""
+        {% if cookiecutter.use_redis == "yes" -%}
+        if self.remote is not None and time.monotonic() >= self.degraded_until:
+            try:
+                return await asyncio.wait_for(self.remote.hit(key, limit, period), self.budget)
+            except (redis.RedisError, asyncio.TimeoutError):
+                # Stop waiting on Redis for a while
+                self.degraded_until = time.monotonic() + self.fallback
+        {% endif -%}
+        return self.local.hit(key, limit, period)
+
+
+# Shared by every rate_limit() dependency
+rate_limiter = RateLimiter(
+    local=LocalTokenBuckets(max_keys=settings.RATE_LIMIT_LOCAL_MAX_KEYS),{% if cookiecutter.use_redis == "yes" %}
+    remote=RedisTokenBuckets(async_redis_client),
+    budget=settings.RATE_LIMIT_REDIS_BUDGET_MS / 1000,
+    fallback=settings.RATE_LIMIT_FALLBACK_SECONDS,{% endif %}
+)
+
+
+def principal(request: Request) -> str:
+    {% if cookiecutter.include_auth == "yes" -%}
+    """Identify who is calling: their verified token subject, else their address."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        # Imported on first use to keep python-jose out of application startup
+        from jose import JWTError, jwt
+
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            payload = {}
+        if payload.get("sub") is not None:
+            return f"user:{payload['sub']}"
+    {% else -%}
+    """Identify who is calling by their address."""
+    {% endif -%}
+    return "addr:" + (request.client.host if request.client else "unknown")
+
+
+def rate_limit(
+    limit: int,
+    period: float,
+    *,
+    limiter: RateLimiter | None = None,
+) -> Callable[[Request, Response], Awaitable[None]]:
+    """
+    Build a dependency allowing each principal ``limit`` calls per ``period`` on a route.
+
+    Use it in the route's ``dependencies``; the bucket is keyed on the
+    principal and the route's method and path template.
+
+    Args:
+        limit: Calls allowed per period (and the largest burst)
+        period: Seconds over which ``limit`` tokens refill
+        limiter: Limiter to use (defaults to the process-wide one)
+
+    Raises:
+        HTTPException: 429 with Retry-After once the bucket is empty
+    """
+
+    async def dependency(request: Request, response: Response) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        route = request.scope.get("route")
+        path = getattr(route, "path", request.url.path)
+        key = f"{principal(request)}:{request.method}:{path}"
+        decision = await (limiter or rate_limiter).hit(key, limit, period)
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded",
+                headers={
+                    "Retry-After": str(math.ceil(decision.retry_after)),
+                    "RateLimit-Limit": str(limit),
+                    "RateLimit-Remaining": "0",
+                },
+            )
+        response.headers["RateLimit-Limit"] = str(limit)
+        response.headers["RateLimit-Remaining"] = str(decision.remaining)
+
+    return dependency
@@ -0,0 +1,110 @@
+"""Fast-path response serialization for trusted CRUD output.
+
+Routes declaring ``response_model`` have FastAPI validate their return value
+against the model, convert it with ``jsonable_encoder`` and encode it with
+the stdlib ``json`` module. Rows read from our own database through the CRUD
+layer already match the schemas, so with ``FAST_RESPONSES`` enabled the hot
+read routes project them onto the schema's fields as plain dicts and encode
+them with orjson in one pass. Returning a ``Response`` makes FastAPI skip
+its own validation; the route's ``response_model`` is still what OpenAPI
+documents.
+
+Every response rendered from data goes through :class:`NegotiatedResponse`,
+which also honours a MessagePack preference recorded by
+:class:`app.api.negotiation.NegotiatedRoute`.
+"""
+
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+from app.api.negotiation import MSGPACK_MEDIA_TYPE, packb, response_msgpack
+from app.core.config import settings
+
+
+class NegotiatedResponse(JSONResponse):
+    """
+    Default response class: MessagePack when negotiated, JSON otherwise.
+
+    JSON is encoded with orjson when ``FAST_RESPONSES`` is enabled and with
+    the stdlib encoder otherwise.
+    """
+
+    # Explicit parameters: FastAPI reads the default status_code off this signature for OpenAPI
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(content, status_code, headers, media_type, background)
+        # The encoding depends on Accept, so shared caches must key on it
+        self.headers.append("Vary", "Accept")
+
+    def render(self, content: Any) -> bytes:
+        if response_msgpack.get():
+            self.media_type = MSGPACK_MEDIA_TYPE
+            return packb(content)
+        if settings.FAST_RESPONSES:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+
+@lru_cache(maxsize=256)
+def _projection(fields: tuple[str, ...], columns: tuple[str, ...]) -> tuple[tuple[str, int], ...]:
+    """Map each response field to its position in a row shape (computed once per shape)."""
+    return tuple((name, columns.index(name)) for name in fields)
+
+
+def trusted_items(model: type[BaseModel], rows: Sequence[Any]) -> list[dict[str, Any]]:
+    """
+    Project trusted rows onto ``model``'s fields without validating them.
+
+    Args:
+        model: Response schema whose fields (and field order) to emit
+        rows: SQLAlchemy rows containing at least those columns; extra
+            columns (e.g. a window ``total``) are ignored
+
+    Returns:
+        One plain dict per row, ready for JSON encoding
+    """
+    if not rows:
+        return []
+    positions = _projection(tuple(model.model_fields), tuple(rows[0]._fields))
+    return [{name: row[index] for name, index in positions} for row in rows]
+
+
+def trusted_item(model: type[BaseModel], row: Any) -> dict[str, Any]:
+    """Project one trusted row onto ``model``'s fields without validating it."""
+    return trusted_items(model, [row])[0]
+
+
+def columnar_items(model: type[BaseModel], rows: Sequence[Any]) -> dict[str, Any]:
+    """
+    Pivot trusted rows into ``model``'s fields as columns, without validating them.
+
+    Returns:
+        ``{"columns": [...], "data": {column: [value, ...]}}``, with one
+        value per row in every column
+    """
+    names = tuple(model.model_fields)
+    if not rows:
+        return {"columns": list(names), "data": {name: [] for name in names}}
+    positions = _projection(names, tuple(rows[0]._fields))
+    return {
+        "columns": list(names),
+        "data": {name: [row[index] for row in rows] for name, index in positions},
+    }
+
+
+def trusted_response(content: Any) -> Response:
+    """Encode already-valid plain data straight to a (negotiated) response."""
+    return NegotiatedResponse(content)
@@ -0,0 +1,33 @@
+"""Per-worker internals: response cache, warm-up and admission counters.
+
+app.main mounts these only with ``STATS_ENDPOINTS_ENABLED``. The paths are
+outside the ``/health`` prefix, so admission control queues and sheds them
+like other requests.{% if cookiecutter.include_auth == "yes" %} Only authenticated users get an answer.{% endif %}
+"""
+
+from fastapi import APIRouter{% if cookiecutter.include_auth == "yes" %}, Depends{% endif %}, Request
+{% if cookiecutter.include_auth == "yes" %}
+from app.api.deps import get_current_user
+{%- endif %}
+from app.middleware.admission import admission_controller
+from app.middleware.response_cache import response_cache
+
+router = APIRouter(prefix="/stats", tags=["stats"]{% if cookiecutter.include_auth == "yes" %}, dependencies=[Depends(get_current_user)]{% endif %})
+
+
+@router.get("/cache")
+async def response_cache_stats() -> dict[str, int]:
+    """Hit/miss counters of this worker's response cache."""
+    return response_cache.stats()
+
+
+@router.get("/warmup")
+async def warmup_timings(request: Request) -> dict[str, float | None]:
+    """Milliseconds each warm-up step of this worker took (None if it failed)."""
+    return getattr(request.app.state, "warmup", {})
+
+
+@router.get("/admission")
+async def admission_stats() -> dict[str, int]:
+    """Admission control counters of this worker."""
+    return admission_controller.stats()
@@ -8,12 +8,14 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.api.negotiation import NegotiatedRoute
 from app.core.config import settings
 from app.core.security import create_access_token
 from app.crud import user as crud
+from app.middleware.compression import no_compression
 from app.schemas.auth import Token, UserCreate, UserResponse
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -55,6 +57,8 @@ async def register(
 
 
 @router.post("/login", response_model=Token)
+# Tokens must not share a compressed body with request input (BREACH)
+@no_compression
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db),
@@ -1,73 +1,158 @@
 """Example endpoint demonstrating API structure."""
 
-from fastapi import APIRouter{% if cookiecutter.use_postgresql == "yes" %}, Depends, HTTPException, status
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.api.deps import get_db
-from app.crud import example as crud
-from app.models.example import Example{% endif %}
-from app.schemas.example import ExampleCreate, ExampleResponse, ExampleUpdate
-from app.schemas.pagination import PaginatedResponse
-from app.tasks.example import example_task
-
-router = APIRouter()
-
+{% if cookiecutter.use_postgresql == "yes" -%}
+from collections.abc import AsyncIterator
+from typing import Any, Literal
+
+{% endif -%}
+from fastapi import APIRouter, Depends{% if cookiecutter.use_postgresql == "yes" %}, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.bulk import bulk_body, bulk_openapi
+from app.api.conditional import (
+    etag,
+    is_not_modified,
+    not_modified,
+    validator_headers,
+    with_headers,
+)
+from app.api.deps import {% if cookiecutter.use_redis == "yes" %}(
+    delete_cache_keys_async,
+    get_cache_many_async,
+    get_db,
+    set_cache_many_async,
+){% else %}get_db{% endif %}
+from app.api.export import (
+    EXPORT_MEDIA_TYPES,
+    ArrowStreamEncoder,
+    arrow_available,
+    encode_csv,
+    encode_ndjson,
+)
+from app.api.fields import Fields, json_response, partial_model, sparse_fields
+from app.api.negotiation import NegotiatedRoute
+from app.api.rate_limit import rate_limit
+from app.api.responses import columnar_items, trusted_item, trusted_items, trusted_response
+from app.core.config import settings
+from app.core.database import get_session_factory
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.core.singleflight import SingleFlight
+from app.crud import example as crud{% else %}
+
+from app.api.negotiation import NegotiatedRoute
+from app.api.rate_limit import rate_limit
+from app.core.config import settings{% endif %}
+from app.middleware.response_cache import cache_response, invalidates_cache
+from app.schemas.example import {% if cookiecutter.use_postgresql == "yes" %}(
+    ExampleBatchRequest,
+    ExampleBatchResponse,
+    ExampleBulkCreateResponse,
+    ExampleBulkUpsertResponse,
+    ExampleCreate,
+    ExampleResponse,
+    ExampleSearchResult,
+    ExampleUpdate,
+    ExampleUpsert,
+    ExampleUpsertResult,
+){% else %}ExampleCreate, ExampleResponse, ExampleUpdate{% endif %}
+from app.schemas.pagination import {% if cookiecutter.use_postgresql == "yes" %}CursorPage, Layout, {% endif %}PaginatedResponse{% if cookiecutter.use_postgresql == "yes" %}, TotalMode{% endif %}
+
+router = APIRouter(route_class=NegotiatedRoute)
+
+# Cached example reads, dropped by every example write
+EXAMPLES_CACHE_TAG = "examples"
+
+# Per-client quotas on writes and on enqueueing Celery tasks
+limit_writes = rate_limit(settings.RATE_LIMIT_WRITES_PER_MINUTE, 60)
+limit_tasks = rate_limit(settings.RATE_LIMIT_TASKS_PER_MINUTE, 60)
+{% if cookiecutter.use_postgresql == "yes" %}
+# Arrow types of the exported columns, in crud.EXAMPLE_COLUMNS order
+EXAMPLE_ARROW_COLUMNS = [("id", "int64"), ("name", "string"), ("description", "string")]
+
+# ?fields= for the read routes; id is always returned
+example_fields = sparse_fields(ExampleResponse)
+
+# Concurrent identical example reads in this worker share one query
+example_reads = SingleFlight()
+{% endif %}
 
 @router.get("/", response_model={% if cookiecutter.use_postgresql == "yes" %}PaginatedResponse[ExampleResponse]{% else %}list[ExampleResponse]{% endif %})
+@cache_response(ttl=2, tags=(EXAMPLES_CACHE_TAG,))
 async def list_examples({% if cookiecutter.use_postgresql == "yes" %}
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
-    name: str | None = None,
-    description: str | None = None,{% endif %}
-) -> {% if cookiecutter.use_postgresql == "yes" %}PaginatedResponse[ExampleResponse]{% else %}list[ExampleResponse]{% endif %}:
+    skip: int = Query(0, ge=0),
+    limit: int = Query(settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    name: str | None = Query(None, min_length=settings.SEARCH_MIN_TERM_LENGTH),
+    description: str | None = Query(None, min_length=settings.SEARCH_MIN_TERM_LENGTH),
+    total_mode: TotalMode = "exact",
+    include_total: bool = True,
+    fields: Fields | None = Depends(example_fields),
+    layout: Layout = "rows",{% endif %}
+) -> {% if cookiecutter.use_postgresql == "yes" %}PaginatedResponse[ExampleResponse] | Response{% else %}list[ExampleResponse]{% endif %}:
     """
     List all examples with pagination and optional filtering.
 
     Args:
         skip: Number of items to skip (for pagination)
-        limit: Maximum number of items to return
-        name: Optional filter by name (partial match)
-        description: Optional filter by description (partial match)
+        limit: Maximum number of items to return (capped at PAGINATION_MAX_LIMIT)
+        name: Optional filter by name (partial match, trigram indexed)
+        description: Optional filter by description (partial match, trigram indexed)
+        total_mode: How to compute the total (exact, estimated, cached or none)
+        include_total: Set to false to skip the total (same as total_mode=none)
+        fields: Comma-separated fields to return (selected in SQL too)
+        layout: ``columnar`` to return ``columns`` and per-column ``data``
+            arrays instead of ``items``
 
     Returns:
-        Paginated list of examples with metadata
+        Paginated list of examples with metadata, or 304 Not Modified when
+        If-None-Match matches the page's ETag
     """
     {% if cookiecutter.use_postgresql == "yes" -%}
-    # Build query with optional filters
-    query = select(Example)
-
-    if name:
-        query = query.where(Example.name.ilike(f"%{name}%"))
-    if description:
-        query = query.where(Example.description.ilike(f"%{description}%"))
-
-    # Get total count
-    count_query = select(func.count()).select_from(Example)
-    if name:
-        count_query = count_query.where(Example.name.ilike(f"%{name}%"))
-    if description:
-        count_query = count_query.where(Example.description.ilike(f"%{description}%"))
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Get paginated items
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
-    items = result.scalars().all()
+    if not include_total:
+        total_mode = "none"
+
+    items, total, total_mode = await example_reads.do(
+        ("page", skip, limit, name, description, total_mode, fields),
+        lambda: crud.get_examples_page(
+            db,
+            skip=skip,
+            limit=limit,
+            name=name,
+            description=description,
+            total_mode=total_mode,
+            fields=fields,
+        ),
+    )
 
     # Calculate pagination metadata
-    page = (skip // limit) + 1 if limit > 0 else 1
-    pages = (total + limit - 1) // limit if limit > 0 else 1
-
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=page,
-        size=limit,
-        pages=pages,
+    page = (skip // limit) + 1
+    pages = (total + limit - 1) // limit if total is not None else None
+
+    item_model = partial_model(ExampleResponse, fields)
+    page_model = PaginatedResponse[item_model]  # type: ignore[valid-type]
+    metadata = {"total": total, "page": page, "size": limit, "pages": pages, "total_mode": total_mode}
+
+    # The page changes exactly when its metadata or a row's version does
+    headers = validator_headers(
+        etag(metadata, fields, layout, [(row.id, row.version) for row in items])
     )
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+
+    result: PaginatedResponse[ExampleResponse] | Response
+    if layout == "columnar":
+        result = trusted_response({**columnar_items(item_model, items), **metadata})
+    elif settings.FAST_RESPONSES:
+        result = trusted_response({"items": trusted_items(item_model, items), **metadata})
+    elif fields is None:
+        result = page_model(items=items, **metadata)
+    else:
+        result = json_response(page_model(items=items, **metadata))
+    return with_headers(result, response, headers)
     {% else -%}
     # Fallback for non-database configuration
     return [
@@ -75,15 +160,296 @@ async def list_examples({% if cookiecutter.use_postgresql == "yes" %}
         ExampleResponse(id=2, name="Example 2", description="Second example"),
     ]
     {% endif %}
+{% if cookiecutter.use_postgresql == "yes" %}
+
+@router.get("/cursor", response_model=CursorPage[ExampleResponse])
+async def list_examples_cursor(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    limit: int = Query(settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    cursor: str | None = None,
+    sort: Literal["id", "name"] = "id",
+    name: str | None = Query(None, min_length=settings.SEARCH_MIN_TERM_LENGTH),
+    description: str | None = Query(None, min_length=settings.SEARCH_MIN_TERM_LENGTH),
+    fields: Fields | None = Depends(example_fields),
+    layout: Layout = "rows",
+) -> CursorPage[ExampleResponse] | Response:
+    """
+    List examples with keyset (cursor) pagination.
+
+    Unlike offset pagination, the cost of a page does not grow with its depth.
+
+    Args:
+        limit: Maximum number of items to return (capped at PAGINATION_MAX_LIMIT)
+        cursor: Opaque cursor from a previous page (omit for the first page)
+        sort: Sort order, by ``id`` or by ``name`` (ties broken by ``id``)
+        name: Optional filter by name (partial match, trigram indexed)
+        description: Optional filter by description (partial match, trigram indexed)
+        fields: Comma-separated fields to return (selected in SQL too)
+        layout: ``columnar`` to return ``columns`` and per-column ``data``
+            arrays instead of ``items``
+
+    Returns:
+        Page of examples with cursors to the next and previous pages, or
+        304 Not Modified when If-None-Match matches the page's ETag
 
+    Raises:
+        HTTPException: 400 if the cursor is invalid
+    """
+    key = None
+    backwards = False
+    if cursor:
+        try:
+            key, backwards = decode_cursor(cursor, sort)
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    items, has_more = await crud.get_examples_keyset(
+        db,
+        limit=limit,
+        sort=sort,
+        key=key,
+        backwards=backwards,
+        name=name,
+        description=description,
+        fields=fields,
+    )
+
+    next_cursor = None
+    prev_cursor = None
+    if items:
+        # Paging backwards always leaves the page we came from ahead of us,
+        # and paging forwards from a cursor always leaves one behind us
+        if has_more or backwards:
+            next_cursor = encode_cursor(sort, crud.keyset_key(items[-1], sort))
+        if (has_more and backwards) or (key is not None and not backwards):
+            prev_cursor = encode_cursor(sort, crud.keyset_key(items[0], sort), backwards=True)
+
+    item_model = partial_model(ExampleResponse, fields)
+    page_model = CursorPage[item_model]  # type: ignore[valid-type]
+    metadata = {"size": limit, "next_cursor": next_cursor, "prev_cursor": prev_cursor}
+
+    headers = validator_headers(
+        etag(metadata, fields, layout, [(row.id, row.version) for row in items])
+    )
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+
+    result: CursorPage[ExampleResponse] | Response
+    if layout == "columnar":
+        result = trusted_response({**columnar_items(item_model, items), **metadata})
+    elif settings.FAST_RESPONSES:
+        result = trusted_response({"items": trusted_items(item_model, items), **metadata})
+    elif fields is None:
+        result = page_model(items=items, **metadata)
+    else:
+        result = json_response(page_model(items=items, **metadata))
+    return with_headers(result, response, headers)
+
+
+@router.get("/search", response_model=PaginatedResponse[ExampleSearchResult])
+async def search_examples(
+    q: str = Query(..., min_length=1, max_length=200),
+    db: AsyncSession = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    layout: Layout = "rows",
+) -> PaginatedResponse[ExampleSearchResult] | Response:
+    """
+    Ranked full-text search over example names and descriptions.
+
+    Args:
+        q: Search terms (supports "quoted phrases", or, and -exclusions)
+        skip: Number of hits to skip (for pagination)
+        limit: Maximum number of hits to return (capped at PAGINATION_MAX_LIMIT)
+        layout: ``columnar`` to return ``columns`` and per-column ``data``
+            arrays instead of ``items``
+
+    Returns:
+        Paginated hits, best match first, with highlighted snippets
+    """
+    items, total = await crud.search_examples(db, q, skip=skip, limit=limit)
+    page_model = PaginatedResponse[ExampleSearchResult]
+    metadata = {
+        "total": total,
+        "page": (skip // limit) + 1,
+        "size": limit,
+        "pages": (total + limit - 1) // limit,
+        "total_mode": "exact",
+    }
+    if layout == "columnar":
+        return trusted_response({**columnar_items(ExampleSearchResult, items), **metadata})
+    if settings.FAST_RESPONSES:
+        return trusted_response({"items": trusted_items(ExampleSearchResult, items), **metadata})
+    return page_model(items=items, **metadata)
+
+
+async def _get_example_batch(db: AsyncSession, ids: list[int]) -> ExampleBatchResponse:
+    """Resolve a multi-get{% if cookiecutter.use_redis == "yes" %}: cache hits via one MGET, the rest via one query{% endif %}."""
+    if len(ids) > settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.BATCH_MAX_IDS} IDs per request",
+        )
+    ids = list(dict.fromkeys(ids))
+
+    found: dict[int, ExampleResponse] = {}
+    {% if cookiecutter.use_redis == "yes" -%}
+    cached = await get_cache_many_async([f"example:{example_id}" for example_id in ids])
+    for example_id, value in zip(ids, cached, strict=True):
+        if value is not None:
+            found[example_id] = ExampleResponse(**value)
+    {% endif -%}
+    misses = [example_id for example_id in ids if example_id not in found]
+
+    if misses:
+        rows = await crud.get_examples_by_ids(db, misses)
+        fetched = {row.id: ExampleResponse.model_validate(row) for row in rows}
+        found.update(fetched){% if cookiecutter.use_redis == "yes" %}
+        await set_cache_many_async(
+            {f"example:{example_id}": item.model_dump() for example_id, item in fetched.items()},
+            ttl=settings.REDIS_CACHE_TTL,
+        ){% endif %}
+
+    return ExampleBatchResponse(
+        items=[found[example_id] for example_id in ids if example_id in found],
+        missing=[example_id for example_id in ids if example_id not in found],
+    )
+
+
+@router.get("/batch", response_model=ExampleBatchResponse)
+async def get_examples_batch(
+    ids: list[int] = Query(..., min_length=1),
+    db: AsyncSession = Depends(get_db),
+) -> ExampleBatchResponse:
+    """
+    Get many examples by ID in one request.
+
+    Args:
+        ids: Example IDs, repeated (``?ids=1&ids=2``), at most BATCH_MAX_IDS
+
+    Returns:
+        Found examples in request order (duplicates collapsed) and the IDs
+        that do not exist
+    """
+    return await _get_example_batch(db, ids)
+
+
+@router.post("/batch", response_model=ExampleBatchResponse)
+async def post_examples_batch(
+    batch_in: ExampleBatchRequest,
+    db: AsyncSession = Depends(get_db),
+) -> ExampleBatchResponse:
+    """
+    Get many examples by ID, for ID lists too long for a query string.
+
+    Args:
+        batch_in: Example IDs, at most BATCH_MAX_IDS
+
+    Returns:
+        Found examples in request order (duplicates collapsed) and the IDs
+        that do not exist
+    """
+    return await _get_example_batch(db, batch_in.ids)
+
+
+async def _export_examples(
+    session_factory: async_sessionmaker[AsyncSession],
+    export_format: str,
+    name: str | None,
+    description: str | None,
+    fields: Fields | None,
+) -> AsyncIterator[bytes]:
+    """Encode matching examples chunk by chunk as they come off the cursor."""
+    columns = [column.key for column in crud.example_columns(fields)]
+    arrow = None
+    if export_format == "arrow":
+        arrow = ArrowStreamEncoder([column for column in EXAMPLE_ARROW_COLUMNS if column[0] in columns])
+    if export_format == "csv":
+        yield encode_csv(columns, [], header=True)
+
+    # The request's session is closed before the body streams, so use our own
+    async with session_factory() as db:
+        async for rows in crud.stream_examples(
+            db,
+            chunk_size=settings.EXPORT_CHUNK_SIZE,
+            name=name,
+            description=description,
+            fields=fields,
+        ):
+            if arrow is not None:
+                yield arrow.encode(rows)
+            elif export_format == "csv":
+                yield encode_csv(columns, rows)
+            else:
+                yield encode_ndjson(columns, rows)
+
+    if arrow is not None:
+        yield arrow.close()
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}},
+    },
+)
+async def export_examples(
+    export_format: Literal["ndjson", "csv", "arrow"] = Query("ndjson", alias="format"),
+    name: str | None = Query(None, min_length=settings.SEARCH_MIN_TERM_LENGTH),
+    description: str | None = Query(None, min_length=settings.SEARCH_MIN_TERM_LENGTH),
+    fields: Fields | None = Depends(example_fields),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> StreamingResponse:
+    """
+    Export all matching examples as NDJSON, CSV or an Arrow IPC stream, ordered by ID.
 
-@router.post("/", response_model=ExampleResponse, status_code=201)
+    Rows are streamed from a server-side cursor in chunks of
+    EXPORT_CHUNK_SIZE, so memory use does not depend on the export size.
+    In Arrow format each chunk is one record batch, built column-wise.
+
+    Args:
+        export_format: Output format, ``ndjson``, ``csv`` or ``arrow``
+            (query parameter ``format``)
+        name: Optional filter by name (partial match, trigram indexed)
+        description: Optional filter by description (partial match, trigram indexed)
+        fields: Comma-separated columns to export (selected in SQL too)
+
+    Returns:
+        Streaming response with the exported rows
+
+    Raises:
+        HTTPException: 501 if Arrow is requested but pyarrow is not installed
+    """
+    if export_format == "arrow" and not arrow_available():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Arrow export is not available (install the 'arrow' extra)",
+        )
+
+    return StreamingResponse(
+        _export_examples(session_factory, export_format, name, description, fields),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="examples.{export_format}"'},
+    )
+{% endif %}
+
+@router.post(
+    "/",
+    response_model=ExampleResponse,
+    status_code=201,
+    dependencies=[Depends(limit_writes)],
+)
+@invalidates_cache(EXAMPLES_CACHE_TAG)
 async def create_example({% if cookiecutter.use_postgresql == "yes" %}
     *,
     db: AsyncSession = Depends(get_db),
-    example_in: ExampleCreate,{% else %}
-    example_in: ExampleCreate,{% endif %}
-) -> ExampleResponse:
+    example_in: ExampleCreate,
+) -> Row[Any]:{% else %}
+    example_in: ExampleCreate,
+) -> ExampleResponse:{% endif %}
     """
     Create a new example.
 
@@ -103,34 +469,156 @@ async def create_example({% if cookiecutter.use_postgresql == "yes" %}
         description=example_in.description,
     )
     {% endif %}
+{% if cookiecutter.use_postgresql == "yes" %}
+
+@router.post(
+    "/bulk",
+    response_model=ExampleBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=bulk_openapi("ExampleCreate"),
+    dependencies=[Depends(limit_writes)],
+)
+@invalidates_cache(EXAMPLES_CACHE_TAG)
+async def bulk_create_examples(
+    examples_in: list[ExampleCreate] = Depends(bulk_body(ExampleCreate)),
+    db: AsyncSession = Depends(get_db),
+) -> ExampleBulkCreateResponse:
+    """
+    Create many examples in one request and one transaction.
+
+    Accepts a JSON array or NDJSON (``Content-Type: application/x-ndjson``,
+    one example per line). Large batches are loaded with COPY.
+
+    Args:
+        examples_in: Examples to create (at most BULK_MAX_ITEMS)
+
+    Returns:
+        IDs of the created examples, in request order
+
+    Raises:
+        HTTPException: 413 if the batch exceeds BULK_MAX_ITEMS or BULK_MAX_BODY_BYTES
+    """
+    ids = await crud.bulk_create_examples(db, examples_in)
+    return ExampleBulkCreateResponse(ids=ids, count=len(ids))
+
+
+@router.put(
+    "/bulk",
+    response_model=ExampleBulkUpsertResponse,
+    openapi_extra=bulk_openapi("ExampleUpsert"),
+    dependencies=[Depends(limit_writes)],
+)
+@invalidates_cache(EXAMPLES_CACHE_TAG)
+async def bulk_upsert_examples(
+    examples_in: list[ExampleUpsert] = Depends(bulk_body(ExampleUpsert)),
+    key: Literal["id", "natural"] = "id",
+    db: AsyncSession = Depends(get_db),
+) -> ExampleBulkUpsertResponse:
+    """
+    Insert or update many examples in one request and one transaction.
+
+    Rows are matched by ``id`` or by the natural key configured in
+    EXAMPLE_NATURAL_KEY; rows without a key value are inserted. If a key
+    appears more than once, the last row wins.
+
+    Args:
+        examples_in: Examples to upsert (at most BULK_MAX_ITEMS)
+        key: Conflict target, ``id`` or ``natural``
+
+    Returns:
+        Per-row outcome (inserted or updated), in request order
 
+    Raises:
+        HTTPException: 400 if key=natural and no natural key is configured,
+            413 if the batch exceeds BULK_MAX_ITEMS or BULK_MAX_BODY_BYTES
+    """
+    conflict_columns = ["id"]
+    if key == "natural":
+        conflict_columns = settings.EXAMPLE_NATURAL_KEY
+        if not conflict_columns or not set(conflict_columns) <= set(ExampleUpsert.model_fields):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No valid natural key is configured for examples",
+            )
+
+    outcomes = await crud.upsert_examples(db, examples_in, conflict_columns=conflict_columns)
+    {% if cookiecutter.use_redis == "yes" -%}
+    await delete_cache_keys_async(*(f"example:{example_id}" for example_id, inserted in outcomes if not inserted))
+    {% endif -%}
+    results = [
+        ExampleUpsertResult(id=example_id, status="inserted" if inserted else "updated")
+        for example_id, inserted in outcomes
+    ]
+    inserted_count = sum(inserted for _, inserted in outcomes)
+    return ExampleBulkUpsertResponse(
+        results=results,
+        inserted=inserted_count,
+        updated=len(outcomes) - inserted_count,
+    )
+{% endif %}
 
 @router.get("/{example_id}", response_model=ExampleResponse)
+@cache_response(ttl=5, tags=(EXAMPLES_CACHE_TAG,))
 async def get_example({% if cookiecutter.use_postgresql == "yes" %}
     example_id: int,
-    db: AsyncSession = Depends(get_db),{% else %}
-    example_id: int,{% endif %}
-) -> ExampleResponse:
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    fields: Fields | None = Depends(example_fields),
+) -> Row[Any] | Response:{% else %}
+    example_id: int,
+) -> ExampleResponse:{% endif %}
     """
     Get a specific example by ID.
 
     Args:
-        example_id: ID of the example to retrieve
+        example_id: ID of the example to retrieve{% if cookiecutter.use_postgresql == "yes" %}
+        fields: Comma-separated fields to return (selected in SQL too){% endif %}
 
     Returns:
-        Example with the specified ID
+        Example with the specified ID{% if cookiecutter.use_postgresql == "yes" %}, or 304 Not Modified when the
+        client's copy (If-None-Match / If-Modified-Since) is current{% endif %}
 
     Raises:
         HTTPException: 404 if example not found
     """
     {% if cookiecutter.use_postgresql == "yes" -%}
-    db_example = await crud.get_example(db=db, example_id=example_id)
-    if not db_example:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Example with id {example_id} not found",
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Example with id {example_id} not found",
+    )
+
+    def validators(row: Any) -> dict[str, str]:
+        return validator_headers(etag(row.id, row.version, fields), row.updated_at)
+
+    if "if-none-match" in request.headers or "if-modified-since" in request.headers:
+        # Revalidate against the version alone before loading the full row
+        version = await example_reads.do(
+            ("version", example_id), lambda: crud.get_example_version(db, example_id)
         )
-    return db_example
+        if version is None:
+            raise not_found
+        headers = validators(version)
+        if is_not_modified(request, headers["ETag"], version.updated_at):
+            return not_modified(headers)
+
+    db_example = await example_reads.do(
+        ("example", example_id, fields),
+        lambda: crud.get_example(db=db, example_id=example_id, fields=fields),
+    )
+    if not db_example:
+        raise not_found
+    headers = validators(db_example)
+
+    item_model = partial_model(ExampleResponse, fields)
+    result: Row[Any] | Response
+    if settings.FAST_RESPONSES:
+        result = trusted_response(trusted_item(item_model, db_example))
+    elif fields is not None:
+        result = json_response(item_model.model_validate(db_example))
+    else:
+        result = db_example
+    return with_headers(result, response, headers)
     {% else -%}
     # Fallback for non-database configuration
     return ExampleResponse(
@@ -141,14 +629,20 @@ async def get_example({% if cookiecutter.use_postgresql == "yes" %}
     {% endif %}
 
 
-@router.put("/{example_id}", response_model=ExampleResponse)
+@router.put(
+    "/{example_id}",
+    response_model=ExampleResponse,
+    dependencies=[Depends(limit_writes)],
+)
+@invalidates_cache(EXAMPLES_CACHE_TAG)
 async def update_example({% if cookiecutter.use_postgresql == "yes" %}
     example_id: int,
     example_in: ExampleUpdate,
-    db: AsyncSession = Depends(get_db),{% else %}
+    db: AsyncSession = Depends(get_db),
+) -> Row[Any]:{% else %}
     example_id: int,
-    example_in: ExampleUpdate,{% endif %}
-) -> ExampleResponse:
+    example_in: ExampleUpdate,
+) -> ExampleResponse:{% endif %}
     """
     Update an existing example.
 
@@ -169,6 +663,9 @@ async def update_example({% if cookiecutter.use_postgresql == "yes" %}
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Example with id {example_id} not found",
         )
+    {% if cookiecutter.use_redis == "yes" -%}
+    await delete_cache_keys_async(f"example:{example_id}")
+    {% endif -%}
     return db_example
     {% else -%}
     # Fallback for non-database configuration
@@ -180,7 +677,12 @@ async def update_example({% if cookiecutter.use_postgresql == "yes" %}
     {% endif %}
 
 
-@router.delete("/{example_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{example_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(limit_writes)],
+)
+@invalidates_cache(EXAMPLES_CACHE_TAG)
 async def delete_example({% if cookiecutter.use_postgresql == "yes" %}
     example_id: int,
     db: AsyncSession = Depends(get_db),{% else %}
@@ -202,13 +704,16 @@ async def delete_example({% if cookiecutter.use_postgresql == "yes" %}
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Example with id {example_id} not found",
         )
+    {% if cookiecutter.use_redis == "yes" -%}
+    await delete_cache_keys_async(f"example:{example_id}")
+    {% endif -%}
     {% else -%}
     # Fallback for non-database configuration
     pass
     {% endif %}
 
 
-@router.post("/task", response_model=dict[str, str])
+@router.post("/task", response_model=dict[str, str], dependencies=[Depends(limit_tasks)])
 async def trigger_example_task(message: str) -> dict[str, str]:
     """
     Trigger an example Celery task.
@@ -221,6 +726,9 @@ async def trigger_example_task(message: str) -> dict[str, str]:
     Returns:
         Task ID and status information
     """
+    # Imported on first use: loading Celery costs every worker startup time
+    from app.tasks.example import example_task
+
     task = example_task.delay(message)
     return {
         "task_id": task.id,
@@ -2,19 +2,20 @@
 """Example endpoint with Redis caching."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import delete_cache, get_cache, get_db, set_cache
+from app.api.deps import delete_cache_keys_async, get_cache_async, get_db, set_cache_async
+from app.api.negotiation import NegotiatedRoute
 from app.crud import example as crud
 from app.schemas.example import ExampleResponse
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get("/{example_id}/cached", response_model=ExampleResponse)
 async def get_example_cached(
     example_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> ExampleResponse:
     """
     Get a specific example by ID with Redis caching.
@@ -36,14 +37,14 @@ async def get_example_cached(
     """
     # Check cache first
     cache_key = f"example:{example_id}"
-    cached_example = get_cache(cache_key)
+    cached_example = await get_cache_async(cache_key)
     
     if cached_example:
         # Return cached result
         return ExampleResponse(**cached_example)
     
     # Cache miss - query database
-    db_example = crud.get_example(db=db, example_id=example_id)
+    db_example = await crud.get_example(db=db, example_id=example_id)
     if not db_example:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -58,12 +59,12 @@ async def get_example_cached(
     }
     
     # Store in cache (1 hour TTL)
-    set_cache(cache_key, example_dict, ttl=3600)
+    await set_cache_async(cache_key, example_dict, ttl=3600)
     
     return ExampleResponse(**example_dict)
 
 
-def invalidate_example_cache(example_id: int) -> None:
+async def invalidate_example_cache(example_id: int) -> None:
     """
     Invalidate cache for a specific example.
 
@@ -73,7 +74,7 @@ def invalidate_example_cache(example_id: int) -> None:
         example_id: ID of the example to invalidate
     """
     cache_key = f"example:{example_id}"
-    delete_cache(cache_key)
+    await delete_cache_keys_async(cache_key)
 {% else -%}
 """Cached endpoint placeholder - Redis not enabled."""
 
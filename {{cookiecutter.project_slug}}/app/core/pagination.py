@@ -0,0 +1,69 @@
+"""Opaque cursor encoding for keyset pagination."""
+
+import base64
+import binascii
+import json
+from typing import Any
+
+# Types of the key values for each sort mode, matching the crud keyset columns
+KEY_TYPES: dict[str, tuple[type, ...]] = {
+    "id": (int,),
+    "name": (str, int),
+}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(sort: str, key: list[Any], *, backwards: bool = False) -> str:
+    """
+    Encode a keyset position into an opaque, URL-safe cursor.
+
+    Args:
+        sort: Sort mode the key belongs to (a cursor is only valid for it)
+        key: Values of the sort columns for the boundary row
+        backwards: Whether the cursor pages towards the start of the list
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {"s": sort, "k": key, "b": backwards}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[list[Any], bool]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor string
+        sort: Sort mode of the current request
+
+    Returns:
+        Tuple of (key values, backwards flag)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed, was issued for another sort,
+            or its key does not match the sort's columns
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+    if not isinstance(payload, dict) or payload.get("s") != sort:
+        raise InvalidCursorError("Cursor does not match the requested sort")
+    key = payload.get("k")
+    types = KEY_TYPES.get(sort)
+    if (
+        types is None
+        or not isinstance(key, list)
+        or len(key) != len(types)
+        # bool is an int subclass, but never a valid key value
+        or not all(type(value) is expected for value, expected in zip(key, types, strict=True))
+    ):
+        raise InvalidCursorError("Malformed cursor")
+    return key, bool(payload.get("b", False))
@@ -1,19 +1,32 @@
 {% if cookiecutter.include_auth == "yes" -%}
-"""Security utilities for authentication and authorization."""
+"""Security utilities for authentication and authorization.
 
-from datetime import datetime, timedelta
-from typing import Any
+python-jose and passlib (with its bcrypt backend) are imported on first use,
+so importing the application does not load them.
+"""
 
-from jose import jwt
-from passlib.context import CryptContext
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@lru_cache(maxsize=1)
+def password_context() -> "CryptContext":
+    """The password hashing context, created on first use."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
     """Create JWT access token."""
+    from jose import jwt
+
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
@@ -26,12 +39,12 @@ def create_access_token(subject: str | Any, expires_delta: timedelta | None = No
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return password_context().hash(password)
 {% else -%}
 """Security placeholder - Authentication not enabled."""
 
@@ -0,0 +1,108 @@
+"""Production server: pre-forked uvicorn workers under gunicorn.
+
+The ``serve`` Poetry script runs the API with one worker process per
+available CPU by default, counting the container's cgroup CPU quota rather
+than the host's cores. The application is imported once in the master
+before forking, so workers start fast and share its memory copy-on-write.
+Each worker is recycled after ``SERVER_MAX_REQUESTS`` requests (plus a
+random jitter, so they do not all restart at once); gunicorn starts its
+replacement and lets it finish in-flight requests first.
+
+For development keep using ``uvicorn app.main:app --reload``.
+"""
+
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+from gunicorn.app.base import BaseApplication
+from gunicorn.util import import_app
+from uvicorn_worker import UvicornWorker
+
+from app.core.config import settings
+
+APP = "app.main:app"
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def cgroup_cpu_limit(root: Path = CGROUP_ROOT) -> float | None:
+    """
+    CPUs granted by the cgroup CPU quota (v2, else v1).
+
+    Returns:
+        The quota in CPUs (possibly fractional), or None when unlimited or
+        not running under a cgroup
+    """
+    try:
+        quota, period = (root / "cpu.max").read_text().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        cfs_quota = int((root / "cpu" / "cpu.cfs_quota_us").read_text())
+        cfs_period = int((root / "cpu" / "cpu.cfs_period_us").read_text())
+    except (OSError, ValueError):
+        return None
+    return cfs_quota / cfs_period if cfs_quota > 0 and cfs_period > 0 else None
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: its affinity mask, capped by the cgroup quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(1, cpus)
+
+
+def worker_count() -> int:
+    """``SERVER_WORKERS`` if set, else one worker per available CPU."""
+    return settings.SERVER_WORKERS or available_cpus()
+
+
+class Worker(UvicornWorker):  # type: ignore[misc]
+    """Uvicorn worker using the configured event loop and HTTP parser."""
+
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+    CONFIG_KWARGS = {"loop": settings.SERVER_LOOP, "http": settings.SERVER_HTTP}
+
+
+def gunicorn_options() -> dict[str, Any]:
+    """Gunicorn settings built from ``Settings``."""
+    return {
+        "bind": f"{settings.HOST}:{settings.PORT}",
+        "workers": worker_count(),
+        "worker_class": f"{__name__}.Worker",
+        "preload_app": True,
+        "max_requests": settings.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+        "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT,
+        "timeout": settings.SERVER_WORKER_TIMEOUT,
+        "keepalive": settings.SERVER_KEEPALIVE,
+        "loglevel": settings.LOG_LEVEL.lower(),
+    }
+
+
+class Server(BaseApplication):  # type: ignore[misc]
+    """Gunicorn application serving ``app.main:app`` with the given options."""
+
+    def __init__(self, options: dict[str, Any]) -> None:
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Any:
+        return import_app(APP)
+
+
+def main() -> None:
+    """Run the production server (the ``serve`` Poetry script)."""
+    Server(gunicorn_options()).run()
@@ -0,0 +1,72 @@
+"""Single-flight coalescing of identical concurrent calls.
+
+When many requests ask for the same thing at the same moment (a popular row
+whose cached copies were just invalidated), only the first one runs the
+lookup; the others await its result instead of issuing their own query.
+Coalescing is per process: each worker runs at most one lookup per key at a
+time.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _LeaderCancelled(Exception):
+    """Set on a call's future when the caller running it was cancelled."""
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time, sharing its outcome with concurrent callers.
+
+    Results are not kept once the call finishes; the next call for the key
+    runs again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        # Calls actually run, and calls answered by another caller's run
+        self.runs = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return ``await fn()``, or the result of an identical call already in flight.
+
+        Args:
+            key: Identifies identical calls (e.g. resource and query options)
+            fn: Performs the call; only invoked when no call for ``key`` is running
+
+        Raises:
+            Exception: Whatever the shared call raised, in every caller
+        """
+        while (future := self._calls.get(key)) is not None:
+            self.shared += 1
+            try:
+                # Shielded, so a waiter giving up does not cancel the shared call
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # The caller running it went away; take over (or join the next run)
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        # Avoid "exception was never retrieved" warnings when nobody else was waiting
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._calls[key] = future
+        self.runs += 1
+        try:
+            result = await fn()
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        except BaseException:
+            future.set_exception(_LeaderCancelled())
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
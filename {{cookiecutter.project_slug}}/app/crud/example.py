@@ -1,65 +1,686 @@
 {% if cookiecutter.use_postgresql == "yes" -%}
 """CRUD operations for Example model."""
 
-from sqlalchemy import select
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, cast
+
+import asyncpg
+from sqlalchemy import (
+    ARRAY,
+    Boolean,
+    ClauseElement,
+    ColumnElement,
+    Executable,
+    Integer,
+    Row,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.dml import ReturningInsert
+
+from app.core.config import settings
+from app.models.example import SEARCH_CONFIG, Example
+from app.schemas.example import ExampleCreate, ExampleUpdate, ExampleUpsert
+from app.schemas.pagination import TotalMode
+
+# Columns returned by reads and writes, matching ExampleResponse. Selecting
+# them as Core rows skips the ORM identity map and attribute instrumentation,
+# which the read-only API paths never use.
+EXAMPLE_COLUMNS = (Example.id, Example.name, Example.description)
+
+# Validator columns selected alongside reads that answer conditional requests
+VERSION_COLUMNS = (Example.version, Example.updated_at)
+
+# Seek columns for each keyset sort mode; ``id`` breaks ties so the key is unique
+KEYSET_SORTS = {
+    "id": (Example.id,),
+    "name": (Example.name, Example.id),
+}
+
+
+def example_columns(fields: Sequence[str] | None = None) -> tuple[Any, ...]:
+    """Return the subset of EXAMPLE_COLUMNS named in ``fields`` (all when None)."""
+    if fields is None:
+        return EXAMPLE_COLUMNS
+    return tuple(column for column in EXAMPLE_COLUMNS if column.key in fields)
+
+
+def versioned_columns(fields: Sequence[str] | None = None) -> tuple[Any, ...]:
+    """Return :func:`example_columns` plus ``id`` and VERSION_COLUMNS, for ETags."""
+    columns = example_columns(fields)
+    keys = {column.key for column in columns}
+    return columns + tuple(
+        column for column in (Example.id, *VERSION_COLUMNS) if column.key not in keys
+    )
+
+
+def _bump_version() -> dict[str, Any]:
+    """SET clause values marking a row as modified."""
+    return {"version": Example.version + 1, "updated_at": func.now()}
+
+
+async def get_example(
+    db: AsyncSession,
+    example_id: int,
+    fields: Sequence[str] | None = None,
+) -> Row[Any] | None:
+    """
+    Get an example by ID, as a read-only row.
+
+    The row has the given fields (all when None) plus ``version`` and
+    ``updated_at``.
+    """
+    result = await db.execute(select(*versioned_columns(fields)).where(Example.id == example_id))
+    return result.one_or_none()
+
+
+async def get_example_version(db: AsyncSession, example_id: int) -> Row[Any] | None:
+    """Get just the ``version`` and ``updated_at`` of an example, to revalidate cheaply."""
+    result = await db.execute(select(Example.id, *VERSION_COLUMNS).where(Example.id == example_id))
+    return result.one_or_none()
+
+
+async def get_examples(db: AsyncSession, skip: int = 0, limit: int = 100) -> list[Row[Any]]:
+    """Get a list of examples, as read-only rows."""
+    result = await db.execute(
+        select(*EXAMPLE_COLUMNS).order_by(Example.id).offset(skip).limit(limit)
+    )
+    return list(result.all())
+
+
+async def get_examples_by_ids(db: AsyncSession, ids: list[int]) -> list[Row[Any]]:
+    """
+    Get many examples by ID with a single ``WHERE id = ANY(:ids)`` query.
+
+    The IDs travel as one array parameter, so the statement is the same for
+    any number of IDs. Rows come back in no particular order.
+    """
+    result = await db.execute(
+        select(*EXAMPLE_COLUMNS).where(
+            Example.id == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+        )
+    )
+    return list(result.all())
+
+
+def contains_filter(column: ColumnElement[str], term: str) -> ColumnElement[bool]:
+    """
+    Case-insensitive substring match served by the column's trigram index.
+
+    LIKE wildcards in the term are escaped so user input cannot widen the
+    pattern. A term needs at least three characters to yield a trigram the
+    GIN index can look up, hence ``SEARCH_MIN_TERM_LENGTH`` on the API side.
+    """
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+# Columns example_filters() matches on; updating them changes filtered counts
+FILTER_COLUMNS = frozenset({"name", "description"})
+
+
+def example_filters(
+    name: str | None = None,
+    description: str | None = None,
+) -> list[ColumnElement[bool]]:
+    """Build the WHERE clauses shared by the example list queries."""
+    filters: list[ColumnElement[bool]] = []
+    if name:
+        filters.append(contains_filter(Example.name, name))
+    if description:
+        filters.append(contains_filter(Example.description, description))
+    return filters
+
+
+def keyset_key(example: Row[Any], sort: str = "id") -> list[Any]:
+    """Return the keyset position of an example for the given sort mode."""
+    return [getattr(example, column.key) for column in KEYSET_SORTS[sort]]
+
+
+def _seek(query: Select[Any], sort: str, key: list[Any], backwards: bool) -> Select[Any]:
+    """Restrict a query to rows strictly after (or before) a keyset position."""
+    columns = KEYSET_SORTS[sort]
+    row = tuple_(*columns) if len(columns) > 1 else columns[0]
+    bound = tuple_(*key) if len(columns) > 1 else key[0]
+    return query.where(row < bound if backwards else row > bound)
+
+
+async def get_examples_keyset(
+    db: AsyncSession,
+    *,
+    limit: int,
+    sort: str = "id",
+    key: list[Any] | None = None,
+    backwards: bool = False,
+    name: str | None = None,
+    description: str | None = None,
+    fields: Sequence[str] | None = None,
+) -> tuple[list[Row[Any]], bool]:
+    """
+    Get a page of examples using keyset (seek) pagination.
+
+    Instead of ``OFFSET``, the query seeks past the last row already seen using
+    the (indexed) sort columns, so every page costs the same as the first one.
+
+    Args:
+        db: Database session
+        limit: Maximum number of items to return
+        sort: Sort mode, one of ``KEYSET_SORTS``
+        key: Keyset position to seek from (None for the first page)
+        backwards: Page towards the start of the list instead of the end
+        name: Optional filter by name (partial match)
+        description: Optional filter by description (partial match)
+        fields: Columns to select (all when None); the sort columns are
+            always selected since the cursor is built from them, and so are
+            ``id`` and ``version`` for the page's ETag
+
+    Returns:
+        Tuple of (rows in ascending sort order, whether more items exist
+        beyond the page in the paging direction)
+    """
+    columns = KEYSET_SORTS[sort]
+    selected = versioned_columns(fields)
+    keys = {column.key for column in selected}
+    selected += tuple(column for column in columns if column.key not in keys)
+    query = select(*selected).where(*example_filters(name, description))
+    if key is not None:
+        query = _seek(query, sort, key, backwards)
+    if backwards:
+        query = query.order_by(*(column.desc() for column in columns))
+    else:
+        query = query.order_by(*columns)
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(query.limit(limit + 1))
+    items = list(result.all())
+    has_more = len(items) > limit
+    items = items[:limit]
+    if backwards:
+        items.reverse()
+    return items, has_more
+
+
+async def stream_examples(
+    db: AsyncSession,
+    *,
+    chunk_size: int = 1000,
+    name: str | None = None,
+    description: str | None = None,
+    fields: Sequence[str] | None = None,
+) -> AsyncIterator[Sequence[Row[Any]]]:
+    """
+    Stream all matching examples from a server-side cursor, ordered by ID.
+
+    Rows are fetched ``chunk_size`` at a time, so memory stays constant no
+    matter how large the table is. The session must stay open (and is kept
+    in a transaction) until iteration finishes.
+
+    Args:
+        db: Database session
+        chunk_size: Rows fetched per round trip and yielded per chunk
+        name: Optional filter by name (partial match)
+        description: Optional filter by description (partial match)
+        fields: Columns to select (all when None)
+
+    Yields:
+        Chunks of rows with the selected columns, in EXAMPLE_COLUMNS order
+    """
+    query = (
+        select(*example_columns(fields))
+        .where(*example_filters(name, description))
+        .order_by(Example.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    result = await db.stream(query)
+    async for partition in result.partitions():
+        yield partition
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` wrapper that keeps the statement's bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    """Compile :class:`_Explain` for PostgreSQL."""
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+# Exact counts per filter hash, mapping key -> (expires_at, total)
+_count_cache: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
 
-from app.models.example import Example
-from app.schemas.example import ExampleCreate, ExampleUpdate
+def _count_cache_key(name: str | None, description: str | None) -> str:
+    """Hash the list filters into a count cache key."""
+    raw = json.dumps([name or None, description or None])
+    return hashlib.sha256(raw.encode()).hexdigest()
 
 
-async def get_example(db: AsyncSession, example_id: int) -> Example | None:
-    """Get an example by ID."""
-    result = await db.execute(select(Example).where(Example.id == example_id))
-    return result.scalar_one_or_none()
+def _get_cached_count(key: str) -> int | None:
+    """Return a cached count if it has not expired."""
+    entry = _count_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, total = entry
+    if expires_at < time.monotonic():
+        _count_cache.pop(key, None)
+        return None
+    return total
+
+
+def _set_cached_count(key: str, total: int) -> None:
+    """Store a count, evicting the oldest entries beyond the size limit."""
+    _count_cache[key] = (time.monotonic() + settings.PAGINATION_COUNT_CACHE_TTL, total)
+    _count_cache.move_to_end(key)
+    while len(_count_cache) > settings.PAGINATION_COUNT_CACHE_SIZE:
+        _count_cache.popitem(last=False)
+
+
+def invalidate_count_cache() -> None:
+    """Forget all cached counts (call after inserts, deletes and updates of filtered columns)."""
+    _count_cache.clear()
+
+
+async def _count_examples(db: AsyncSession, filters: list[ColumnElement[bool]]) -> int:
+    """Run an exact ``count(*)`` for the given filters."""
+    result = await db.execute(select(func.count()).select_from(Example).where(*filters))
+    return int(result.scalar_one())
+
+
+async def _estimate_examples(db: AsyncSession, filters: list[ColumnElement[bool]]) -> int | None:
+    """
+    Estimate the number of matching examples from planner statistics.
+
+    Unfiltered lists read ``pg_class.reltuples``; filtered lists use the row
+    estimate of ``EXPLAIN``. Returns None when there is no usable estimate:
+    ``reltuples`` is -1 for a table never analyzed on PostgreSQL 14+, but 0
+    on older servers, so a non-positive value is never trusted.
+    """
+    if not filters:
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": Example.__tablename__},
+        )
+        estimate = result.scalar_one_or_none()
+        # An empty table counts exactly for next to nothing anyway
+        return int(estimate) if estimate is not None and estimate > 0 else None
+
+    result = await db.execute(_Explain(select(Example.id).where(*filters)))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def get_examples_page(
+    db: AsyncSession,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    name: str | None = None,
+    description: str | None = None,
+    total_mode: TotalMode = "exact",
+    fields: Sequence[str] | None = None,
+) -> tuple[list[Row[Any]], int | None, TotalMode]:
+    """
+    Get a page of examples together with the total matching count.
 
+    Args:
+        db: Database session
+        skip: Number of items to skip
+        limit: Maximum number of items to return
+        name: Optional filter by name (partial match)
+        description: Optional filter by description (partial match)
+        total_mode: How to obtain the total:
+            ``exact`` folds ``count(*) OVER()`` into the page query,
+            ``estimated`` uses planner statistics,
+            ``cached`` reuses a recent exact count for the same filters,
+            ``none`` skips the total entirely
+        fields: Columns to select (all when None); ``id`` and ``version``
+            are always selected for the page's ETag
+
+    Returns:
+        Tuple of (rows, total or None, total mode actually used); estimated
+        and cached modes fall back to an exact count when no value is available
+    """
+    filters = example_filters(name, description)
+    page_query = (
+        select(*versioned_columns(fields))
+        .where(*filters)
+        .order_by(Example.id)
+        .offset(skip)
+        .limit(limit)
+    )
+
+    total: int | None = None
+    if total_mode == "estimated":
+        total = await _estimate_examples(db, filters)
+    elif total_mode == "cached":
+        total = _get_cached_count(_count_cache_key(name, description))
+
+    if total is not None or total_mode == "none":
+        result = await db.execute(page_query)
+        return list(result.all()), total, total_mode
+
+    # Exact count in the same round trip as the page
+    result = await db.execute(page_query.add_columns(func.count().over().label("total")))
+    # Rows carry an extra ``total`` column, which the response schema ignores
+    items = list(result.all())
+    if items:
+        total = int(items[0].total)
+    elif skip == 0:
+        total = 0
+    else:
+        # Past the last page the window has no rows to report the count on
+        total = await _count_examples(db, filters)
+
+    if total_mode == "cached":
+        # Cache miss: remember the exact count for the following pages
+        _set_cached_count(_count_cache_key(name, description), total)
+    return items, total, "exact"
+
+
+async def search_examples(
+    db: AsyncSession,
+    query: str,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+) -> tuple[list[Row[Any]], int]:
+    """
+    Full-text search over example names and descriptions.
+
+    Matches against the trigger-maintained, GIN-indexed ``search_vector`` column using
+    web search syntax (quoted phrases, ``or``, ``-exclusion``), ranked by
+    ``ts_rank_cd``. Snippets are only built for the rows on the requested page.
+
+    Args:
+        db: Database session
+        query: Search terms in web search syntax
+        skip: Number of hits to skip
+        limit: Maximum number of hits to return
+
+    Returns:
+        Tuple of (rows with id, name, description, rank and snippet, total hits)
+    """
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+    rank = func.ts_rank_cd(Example.search_vector, ts_query)
+    matches = Example.search_vector.op("@@")(ts_query)
+
+    # Rank and page on the index first, then highlight just the page
+    ranked = (
+        select(Example.id, rank.label("rank"), func.count().over().label("total"))
+        .where(matches)
+        .order_by(rank.desc(), Example.id)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+    snippet = func.ts_headline(
+        SEARCH_CONFIG,
+        func.coalesce(Example.description, Example.name),
+        ts_query,
+        "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5",
+    )
+    page_query = (
+        select(
+            Example.id,
+            Example.name,
+            Example.description,
+            ranked.c.rank,
+            ranked.c.total,
+            snippet.label("snippet"),
+        )
+        .join(ranked, ranked.c.id == Example.id)
+        .order_by(ranked.c.rank.desc(), Example.id)
+    )
 
-async def get_examples(db: AsyncSession, skip: int = 0, limit: int = 100) -> list[Example]:
-    """Get a list of examples."""
-    result = await db.execute(select(Example).offset(skip).limit(limit))
-    return list(result.scalars().all())
+    result = await db.execute(page_query)
+    rows = list(result.all())
+    if rows:
+        total = int(rows[0].total)
+    elif skip == 0:
+        total = 0
+    else:
+        count = await db.execute(select(func.count()).select_from(Example).where(matches))
+        total = int(count.scalar_one())
+    return rows, total
 
 
-async def create_example(db: AsyncSession, example: ExampleCreate) -> Example:
-    """Create a new example."""
-    db_example = Example(
-        name=example.name,
-        description=example.description,
+async def create_example(db: AsyncSession, example: ExampleCreate) -> Row[Any]:
+    """Create a new example with a single INSERT ... RETURNING."""
+    result = await db.execute(
+        insert(Example)
+        .values(name=example.name, description=example.description)
+        .returning(*EXAMPLE_COLUMNS)
     )
-    db.add(db_example)
+    db_example = result.one()
     await db.commit()
-    await db.refresh(db_example)
+    invalidate_count_cache()
     return db_example
 
 
+async def _copy_examples(db: AsyncSession, examples: list[ExampleCreate]) -> list[int]:
+    """Insert examples with asyncpg's binary COPY, returning their IDs in order."""
+    # COPY cannot return generated keys, so reserve the IDs from the sequence first
+    result = await db.execute(
+        text(
+            "SELECT nextval(pg_get_serial_sequence(:table, 'id')) "
+            "FROM generate_series(1, :count)"
+        ),
+        {"table": Example.__tablename__, "count": len(examples)},
+    )
+    ids = [int(example_id) for example_id in result.scalars()]
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    # The engine always runs on asyncpg, whose connection the adapter wraps
+    driver_connection = cast(asyncpg.Connection, raw_connection.driver_connection)
+    await driver_connection.copy_records_to_table(
+        Example.__tablename__,
+        records=[
+            (example_id, example.name, example.description)
+            for example_id, example in zip(ids, examples, strict=True)
+        ],
+        columns=["id", "name", "description"],
+    )
+    return ids
+
+
+async def bulk_create_examples(db: AsyncSession, examples: list[ExampleCreate]) -> list[int]:
+    """
+    Create many examples in one transaction.
+
+    Batches of at least ``BULK_COPY_THRESHOLD`` rows are streamed with COPY;
+    smaller ones use a multi-row INSERT ... RETURNING.
+
+    Args:
+        db: Database session
+        examples: Validated examples to create
+
+    Returns:
+        IDs of the created examples, in the same order as ``examples``
+    """
+    if not examples:
+        return []
+
+    if len(examples) >= settings.BULK_COPY_THRESHOLD:
+        ids = await _copy_examples(db, examples)
+    else:
+        result = await db.execute(
+            insert(Example).returning(Example.id, sort_by_parameter_order=True),
+            [{"name": example.name, "description": example.description} for example in examples],
+        )
+        ids = list(result.scalars().all())
+
+    await db.commit()
+    invalidate_count_cache()
+    return ids
+
+
+async def upsert_examples(
+    db: AsyncSession,
+    examples: list[ExampleUpsert],
+    *,
+    conflict_columns: list[str] | None = None,
+) -> list[tuple[int, bool]]:
+    """
+    Insert or update many examples with ``INSERT ... ON CONFLICT DO UPDATE``.
+
+    Rows are matched on ``conflict_columns``, which must be backed by a unique
+    index. Rows with a missing key value are plain inserts. When the same key
+    appears more than once, the last occurrence wins. Statements are batched by
+    SQLAlchemy, so thousands of rows take a handful of round trips.
+
+    Args:
+        db: Database session
+        examples: Validated rows to upsert
+        conflict_columns: Conflict target, defaults to the primary key
+
+    Returns:
+        One (id, inserted) pair per input row, in input order; ``inserted`` is
+        False when an existing row was updated
+    """
+    conflict_columns = conflict_columns or ["id"]
+    if not examples:
+        return []
+
+    # Later duplicates win; PostgreSQL refuses to update one row twice per statement
+    keyed: dict[tuple[Any, ...], ExampleUpsert] = {}
+    unkeyed: list[ExampleUpsert] = []
+    for example in examples:
+        key = tuple(getattr(example, column) for column in conflict_columns)
+        if any(value is None for value in key):
+            unkeyed.append(example)
+        else:
+            keyed[key] = example
+
+    fields = {"name", "description"} | set(conflict_columns)
+    outcomes: dict[tuple[Any, ...], tuple[int, bool]] = {}
+    if keyed:
+        insert_statement = pg_insert(Example)
+        upsert: ReturningInsert[tuple[int, bool]] = insert_statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={
+                **{
+                    column: insert_statement.excluded[column]
+                    for column in fields - set(conflict_columns)
+                },
+                **_bump_version(),
+            },
+        ).returning(
+            Example.id,
+            # xmax is zero for freshly inserted tuples
+            literal_column("(xmax = 0)", Boolean).label("inserted"),
+            sort_by_parameter_order=True,
+        )
+        result = await db.execute(
+            upsert,
+            [example.model_dump(include=fields) for example in keyed.values()],
+        )
+        for key, row in zip(keyed, result.all(), strict=True):
+            outcomes[key] = (int(row.id), bool(row.inserted))
+
+        # Explicit IDs bypass the sequence; move it past them to avoid future collisions
+        if "id" in conflict_columns and any(inserted for _, inserted in outcomes.values()):
+            await db.execute(
+                text(
+                    "SELECT setval(sequence, GREATEST("
+                    "(SELECT max(id) FROM examples), "
+                    "COALESCE(pg_sequence_last_value(sequence::regclass), 1))) "
+                    "FROM pg_get_serial_sequence(:table, 'id') AS sequence"
+                ),
+                {"table": Example.__tablename__},
+            )
+
+    inserted_ids: list[int] = []
+    if unkeyed:
+        result = await db.execute(
+            insert(Example).returning(Example.id, sort_by_parameter_order=True),
+            [{"name": example.name, "description": example.description} for example in unkeyed],
+        )
+        inserted_ids = list(result.scalars().all())
+
+    await db.commit()
+    invalidate_count_cache()
+
+    new_ids = iter(inserted_ids)
+    results = []
+    for example in examples:
+        key = tuple(getattr(example, column) for column in conflict_columns)
+        results.append(outcomes[key] if key in outcomes else (next(new_ids), True))
+    return results
+
+
 async def update_example(
     db: AsyncSession,
     example_id: int,
     example: ExampleUpdate,
-) -> Example | None:
-    """Update an existing example."""
-    db_example = await get_example(db, example_id)
-    if not db_example:
-        return None
+) -> Row[Any] | None:
+    """
+    Update an existing example with a single UPDATE ... RETURNING.
 
+    Returns None if no example has the given ID.
+    """
     update_data = example.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_example, field, value)
+    if not update_data:
+        result = await db.execute(select(*EXAMPLE_COLUMNS).where(Example.id == example_id))
+        return result.one_or_none()
 
+    result = await db.execute(
+        update(Example)
+        .where(Example.id == example_id)
+        .values(**update_data, **_bump_version())
+        .returning(*EXAMPLE_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+    db_example = result.one_or_none()
     await db.commit()
-    await db.refresh(db_example)
+    if db_example is not None and update_data.keys() & FILTER_COLUMNS:
+        # The row may have moved into or out of filtered result sets
+        invalidate_count_cache()
     return db_example
 
 
 async def delete_example(db: AsyncSession, example_id: int) -> bool:
-    """Delete an example."""
-    db_example = await get_example(db, example_id)
-    if not db_example:
-        return False
+    """
+    Delete an example with a single DELETE ... RETURNING.
 
-    await db.delete(db_example)
+    Returns False if no example has the given ID.
+    """
+    result = await db.execute(
+        delete(Example)
+        .where(Example.id == example_id)
+        .returning(Example.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = result.scalar_one_or_none() is not None
     await db.commit()
-    return True
+    if deleted:
+        invalidate_count_cache()
+    return deleted
 {% else -%}
 """CRUD placeholder - PostgreSQL not enabled."""
 
@@ -0,0 +1,131 @@
+"""Application lifespan: warm-up on startup, resource cleanup on shutdown.
+
+Without it a fresh worker pays on its first requests for opening database
+connections, connecting to Redis, loading the password hashing backend and
+building the OpenAPI document (the JSON schemas of every model). With
+``WARMUP_ENABLED`` these run before the worker accepts traffic, each step
+timed and logged. A failing step is logged and skipped, so an unavailable
+dependency only delays its own first use, as before. On shutdown the
+database pool and Redis connections are closed.
+"""
+
+{% if cookiecutter.use_postgresql == "yes" -%}
+import asyncio
+{% endif -%}
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+{% if cookiecutter.use_postgresql == "yes" -%}
+from sqlalchemy import text
+{% endif %}
+{% if cookiecutter.use_redis == "yes" -%}
+from app.api.deps import async_redis_client, redis_client
+{% endif -%}
+from app.core.config import settings
+{% if cookiecutter.use_postgresql == "yes" -%}
+from app.core.database import engine
+{% endif -%}
+{% if cookiecutter.include_auth == "yes" -%}
+from app.core.security import create_access_token, password_context
+{% endif %}
+logger = logging.getLogger(__name__)
+
+Step = Callable[[], Awaitable[None]]
+{% if cookiecutter.use_postgresql == "yes" %}
+
+async def warm_database() -> None:
+    """Open ``DATABASE_WARMUP_CONNECTIONS`` connections, leaving them in the pool."""
+    # Connections beyond the pool size would be closed again when returned
+    count = min(settings.DATABASE_WARMUP_CONNECTIONS, settings.DATABASE_POOL_SIZE)
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(count)),
+        return_exceptions=True,
+    )
+    connections = [result for result in results if not isinstance(result, BaseException)]
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        for connection in connections:
+            await connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            await connection.close()
+{% endif %}{% if cookiecutter.use_redis == "yes" %}
+
+async def warm_redis() -> None:
+    """Open a connection of the asyncio Redis pool."""
+    await async_redis_client.ping()
+{% endif %}{% if cookiecutter.include_auth == "yes" %}
+
+async def warm_security() -> None:
+    """Import and load the password hashing backend, and run a JWT round trip."""
+    from jose import jwt
+
+    password_context().handler().get_backend()
+    token = create_access_token("warm-up")
+    jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+{% endif %}
+
+async def warm_up(steps: dict[str, Step]) -> dict[str, float | None]:
+    """
+    Run warm-up steps in order, logging how long each took.
+
+    Returns:
+        Milliseconds per step, None for steps that failed
+    """
+    timings: dict[str, float | None] = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        try:
+            await step()
+        except Exception:
+            logger.warning("Warm-up step %r failed", name, exc_info=True)
+            timings[name] = None
+        else:
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info("Warm-up finished: %s", timings)
+    return timings
+
+
+def warm_up_steps(app: FastAPI) -> dict[str, Step]:
+    """The warm-up steps for ``app``, in the order they run."""
+
+    async def warm_openapi() -> None:
+        app.openapi()
+
+    return {
+        {% if cookiecutter.use_postgresql == "yes" -%}
+        "database": warm_database,
+        {% endif -%}
+        {% if cookiecutter.use_redis == "yes" -%}
+        "redis": warm_redis,
+        {% endif -%}
+        {% if cookiecutter.include_auth == "yes" -%}
+        "security": warm_security,
+        {% endif -%}
+        "openapi": warm_openapi,
+    }
+
+
+async def shutdown() -> None:
+    """Close pooled connections."""
+    {% if cookiecutter.use_postgresql == "yes" -%}
+    await engine.dispose()
+    {% endif -%}
+    {% if cookiecutter.use_redis == "yes" -%}
+    await async_redis_client.aclose(close_connection_pool=True)
+    redis_client.close()
+    {% endif -%}
+    logger.info("Connections closed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the worker up before it serves, and release its resources after."""
+    app.state.warmup = await warm_up(warm_up_steps(app)) if settings.WARMUP_ENABLED else {}
+    yield
+    await shutdown()
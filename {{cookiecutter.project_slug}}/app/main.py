@@ -1,16 +1,27 @@
 """Main FastAPI application."""
 
+from pathlib import Path
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api import stats
+from app.api.responses import NegotiatedResponse
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.lifespan import lifespan
+from app.middleware.admission import AdmissionMiddleware
+from app.middleware.compression import CompressionMiddleware, no_compression
+from app.middleware.response_cache import ResponseCacheMiddleware, cache_response
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     version="{{ cookiecutter.version }}",
     description="{{ cookiecutter.project_description }}",
+    default_response_class=NegotiatedResponse,
+    lifespan=lifespan,
 )
 
 # Set up CORS
@@ -23,17 +34,36 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+# Cap in-flight requests and shed overload with 503 (cache hits are served regardless)
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware)
+
+# Cache responses of @cache_response routes (inside compression, so bodies are stored as-is)
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(ResponseCacheMiddleware)
+
+# Compress response bodies (see app.middleware.compression)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# Per-worker cache, warm-up and admission counters (see app.api.stats)
+if settings.STATS_ENDPOINTS_ENABLED:
+    app.include_router(stats.router)
+
 
 @app.get("/health")
+@no_compression
+@cache_response(ttl=1)
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy"}
 
 
 @app.get("/")
+@cache_response(ttl=60)
 async def root() -> dict[str, str]:
     """Root endpoint."""
     return {
@@ -41,3 +71,8 @@ async def root() -> dict[str, str]:
         "docs": "/docs",
         "redoc": "/redoc",
     }
+
+
+# Serve the OpenAPI document exported at build time instead of generating it
+if settings.OPENAPI_SCHEMA_FILE and Path(settings.OPENAPI_SCHEMA_FILE).is_file():
+    app.openapi_schema = orjson.loads(Path(settings.OPENAPI_SCHEMA_FILE).read_bytes())
@@ -0,0 +1,177 @@
+"""Admission control and load shedding middleware.
+
+Each worker admits at most ``ADMISSION_MAX_IN_FLIGHT`` requests at a time;
+the rest wait in a FIFO queue. How long they may wait depends on the
+measured queue time, CoDel style: while the queue keeps draining, a request
+may wait up to ``ADMISSION_QUEUE_TIMEOUT_MS`` to absorb a burst. Once the
+queue has not been empty for a whole ``ADMISSION_CODEL_INTERVAL_MS`` (a
+standing queue, i.e. sustained overload), waits are cut to
+``ADMISSION_CODEL_TARGET_MS``. Requests that cannot be admitted in time get
+``503`` with ``Retry-After`` instead of adding seconds of latency for
+everyone.
+
+Paths are prioritised by prefix: critical ones (health checks, auth) are
+never queued or shed, low-priority ones (bulk work) are shed instead of
+queued whenever the worker is full.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Literal
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+Priority = Literal["critical", "normal", "low"]
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a CoDel-style bounded wait.
+
+    Args:
+        max_in_flight: Requests running at once
+        queue_timeout: Longest wait, in seconds, while the queue keeps draining
+        target: Longest wait, in seconds, once a standing queue has formed
+        interval: Seconds the queue must stay non-empty to count as standing
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        queue_timeout: float,
+        target: float,
+        interval: float,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.queue_timeout = queue_timeout
+        self.target = target
+        self.interval = interval
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_empty = time.monotonic()
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+
+    def _wait_limit(self) -> float:
+        """Seconds a newly queued request may wait for a slot."""
+        standing = time.monotonic() - self._last_empty > self.interval
+        return self.target if standing else self.queue_timeout
+
+    async def acquire(self, *, wait: bool = True) -> bool:
+        """
+        Take a slot, waiting for one if allowed.
+
+        Returns:
+            True once admitted (call :meth:`release` when done), False if
+            the request should be shed
+        """
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            self._last_empty = time.monotonic()
+            return True
+        if not wait:
+            self.shed += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            await asyncio.wait_for(waiter, self._wait_limit())
+        except asyncio.TimeoutError:
+            # release() may have handed us the slot just as the wait ran out
+            if waiter.cancelled() or not waiter.done():
+                self.shed += 1
+                return False
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled after being handed a slot: pass it on
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        self.admitted += 1
+        return True
+
+    def release(self) -> None:
+        """Give a slot back, handing it straight to the oldest waiter if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+        self._last_empty = time.monotonic()
+
+    def stats(self) -> dict[str, int]:
+        """Admission counters and current load."""
+        return {
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+        }
+
+
+# Shared by the middleware and the stats endpoint
+admission_controller = AdmissionController(
+    max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+    queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_MS / 1000,
+    target=settings.ADMISSION_CODEL_TARGET_MS / 1000,
+    interval=settings.ADMISSION_CODEL_INTERVAL_MS / 1000,
+)
+
+
+def route_priority(path: str) -> Priority:
+    """Priority of a request path, from the configured path prefixes."""
+    if path.startswith(tuple(settings.ADMISSION_CRITICAL_PATHS)):
+        return "critical"
+    if path.startswith(tuple(settings.ADMISSION_LOW_PRIORITY_PATHS)):
+        return "low"
+    return "normal"
+
+
+class AdmissionMiddleware:
+    """
+    Admit, queue or shed HTTP requests (see the module docstring).
+
+    Args:
+        app: ASGI application to wrap
+        controller: Controller to use (defaults to the process-wide one)
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController | None = None) -> None:
+        self.app = app
+        self.controller = admission_controller if controller is None else controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        priority = route_priority(scope["path"])
+        if priority == "critical":
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.controller.acquire(wait=priority != "low"):
+            response = JSONResponse(
+                {"detail": "Server is overloaded, retry later"},
+                status_code=503,
+                headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
@@ -0,0 +1,263 @@
+"""Response compression middleware.
+
+Responses are compressed with the best encoding the client accepts out of
+``COMPRESSION_ENCODINGS``: gzip is always available, zstd and brotli when
+``zstandard`` / ``brotli`` are installed. Complete bodies smaller than
+``COMPRESSION_MIN_SIZE`` are sent as-is. Streaming bodies are compressed
+chunk by chunk and flushed after every chunk, so clients keep receiving
+rows as they are produced instead of when the compressor's buffer fills.
+
+Routes opt out with the :func:`no_compression` decorator.
+"""
+
+import zlib
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_ZSTD = False
+
+try:
+    import brotli
+
+    HAS_BROTLI = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_BROTLI = False
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+# Endpoint attribute set by no_compression
+_NO_COMPRESSION = "__no_compression__"
+
+# Media types that are already compressed
+_INCOMPRESSIBLE_PREFIXES = ("image/", "audio/", "video/", "application/zip", "application/gzip")
+
+
+def no_compression(endpoint: EndpointT) -> EndpointT:
+    """Mark a route endpoint whose responses must never be compressed."""
+    setattr(endpoint, _NO_COMPRESSION, True)
+    return endpoint
+
+
+class Compressor(Protocol):
+    """Incremental compressor for one response body."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it, so it can be decoded on arrival."""
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+
+
+class GzipCompressor:
+    """gzip through zlib."""
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class ZstdCompressor:
+    """Zstandard through the ``zstandard`` package."""
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        compressed: bytes = self._compressor.compress(data)
+        compressed += self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return compressed
+
+    def finish(self) -> bytes:
+        finished: bytes = self._compressor.flush()
+        return finished
+
+
+class BrotliCompressor:
+    """Brotli through the ``brotli`` package."""
+
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        compressed: bytes = self._compressor.process(data) + self._compressor.flush()
+        return compressed
+
+    def finish(self) -> bytes:
+        finished: bytes = self._compressor.finish()
+        return finished
+
+
+def available_encodings() -> dict[str, Callable[[], Compressor]]:
+    """Compressor factories for the enabled encodings whose library is installed."""
+    factories: dict[str, Callable[[], Compressor]] = {
+        "gzip": lambda: GzipCompressor(settings.COMPRESSION_GZIP_LEVEL),
+    }
+    if HAS_ZSTD:
+        factories["zstd"] = lambda: ZstdCompressor(settings.COMPRESSION_ZSTD_LEVEL)
+    if HAS_BROTLI:
+        factories["br"] = lambda: BrotliCompressor(settings.COMPRESSION_BROTLI_QUALITY)
+    return {
+        encoding: factories[encoding]
+        for encoding in settings.COMPRESSION_ENCODINGS
+        if encoding in factories
+    }
+
+
+def choose_encoding(accept_encoding: str | None, encodings: list[str]) -> str | None:
+    """
+    Pick the encoding to use for an Accept-Encoding header.
+
+    Args:
+        accept_encoding: The request's Accept-Encoding header
+        encodings: Supported encodings, most preferred first; breaks ties
+            between encodings the client accepts equally
+
+    Returns:
+        The chosen encoding, or None to send the body as-is
+    """
+    if not accept_encoding:
+        return None
+
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress HTTP response bodies (see the module docstring).
+
+    Args:
+        app: ASGI application to wrap
+        minimum_size: Complete bodies smaller than this are not compressed
+            (defaults to COMPRESSION_MIN_SIZE)
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int | None = None) -> None:
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        encoding = choose_encoding(accept_encoding, list(self.encodings))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        factory = self.encodings[encoding]
+        responder = _CompressedResponder(scope, send, encoding, factory, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressedResponder:
+    """Rewrites one response's messages, compressing its body."""
+
+    def __init__(
+        self,
+        scope: Scope,
+        send: Send,
+        encoding: str,
+        factory: Callable[[], Compressor],
+        minimum_size: int,
+    ) -> None:
+        self.scope = scope
+        self.next_send = send
+        self.encoding = encoding
+        self.factory = factory
+        self.minimum_size = minimum_size
+        self.start: Message | None = None
+        self.compressor: Compressor | None = None
+        self.passthrough = False
+
+    def _skip(self, headers: Headers) -> bool:
+        """Whether this response must go out uncompressed."""
+        # The router has recorded the matched endpoint in the shared scope by now
+        endpoint = self.scope.get("endpoint")
+        if getattr(endpoint, _NO_COMPRESSION, False):
+            return True
+        content_type = headers.get("content-type", "")
+        return "content-encoding" in headers or content_type.startswith(_INCOMPRESSIBLE_PREFIXES)
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = self._skip(Headers(raw=message["headers"]))
+            if self.passthrough:
+                await self.next_send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.next_send(message)
+            return
+
+        assert self.start is not None
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not more_body and len(body) < self.minimum_size:
+                # A complete body too small to be worth compressing
+                self.passthrough = True
+                await self.next_send(self.start)
+                await self.next_send(message)
+                return
+
+            self.compressor = self.factory()
+            headers = MutableHeaders(raw=self.start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # A strong ETag names exact bytes, which the encoded body no longer has
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                # Streaming: the compressed length is unknown until the end
+                del headers["Content-Length"]
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self.next_send(self.start)
+                await self.next_send({"type": "http.response.body", "body": body})
+                return
+            await self.next_send(self.start)
+
+        chunk = self.compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.next_send({"type": "http.response.body", "body": chunk, "more_body": more_body})
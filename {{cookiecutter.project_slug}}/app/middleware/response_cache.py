@@ -0,0 +1,270 @@
+"""In-process HTTP response cache middleware.
+
+GET routes opt in with :func:`cache_response`, giving the time-to-live of
+their responses. Responses are keyed on the path, the normalised query
+string, the caller's credentials and the Accept and Origin headers, and
+kept in a size-bounded LRU per worker process. Routes decorated with
+:func:`invalidates_cache` drop every entry sharing one of their tags when
+they succeed; other workers' copies expire with their TTL.
+
+Only complete (non-streaming) 200 responses are stored. Conditional
+requests (If-None-Match / If-Modified-Since) bypass the cache so routes can
+answer them with 304.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+# Endpoint attributes set by the decorators
+_CACHE_TTL = "__cache_ttl__"
+_CACHE_TAGS = "__cache_tags__"
+_INVALIDATES = "__invalidates_cache__"
+
+
+def cache_response(ttl: float, *, tags: Iterable[str] = ()) -> Callable[[EndpointT], EndpointT]:
+    """
+    Cache a GET route's responses for ``ttl`` seconds.
+
+    Args:
+        ttl: Seconds a response is served from the cache
+        tags: Names that :func:`invalidates_cache` routes can drop the
+            cached responses by
+    """
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        setattr(endpoint, _CACHE_TTL, ttl)
+        setattr(endpoint, _CACHE_TAGS, frozenset(tags))
+        return endpoint
+
+    return decorator
+
+
+def invalidates_cache(*tags: str) -> Callable[[EndpointT], EndpointT]:
+    """Drop the cached responses tagged with ``tags`` whenever this route succeeds."""
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        setattr(endpoint, _INVALIDATES, frozenset(tags))
+        return endpoint
+
+    return decorator
+
+
+@dataclass
+class CachedResponse:
+    """A stored response."""
+
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    expires: float
+    tags: frozenset[str]
+
+
+class ResponseCache:
+    """
+    LRU of responses bounded by entry count and total body size.
+
+    Args:
+        max_entries: Maximum number of responses kept
+        max_bytes: Maximum total size of the kept bodies
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        # Bumped by every invalidation, so responses computed across one are not stored
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the live entry for ``key``, marking it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store ``entry``, evicting the least recently used ones beyond the bounds."""
+        if len(entry.body) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._size += len(entry.body)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.body)
+            self.evictions += 1
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every entry tagged with any of ``tags``."""
+        self.generation += 1
+        dropped = [key for key, entry in self._entries.items() if entry.tags.intersection(tags)]
+        for key in dropped:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.generation += 1
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current occupancy."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
+
+    def _remove(self, key: str) -> None:
+        self._size -= len(self._entries.pop(key).body)
+
+
+# Shared by the middleware and invalidate_cache()
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
+
+
+def invalidate_cache(*tags: str) -> None:
+    """Drop this process's cached responses tagged with ``tags`` (for writes outside routes)."""
+    response_cache.invalidate(*tags)
+
+
+def cache_key(scope: Scope, headers: Headers) -> str:
+    """Key a request on path, normalised query, credentials, Accept and Origin."""
+    params = parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+    query = urlencode(sorted(params))
+    # Responses may depend on who is asking; key on a digest of the credentials
+    principal = hashlib.sha256(headers.get("authorization", "").encode()).hexdigest()[:16]
+    # CORS runs inside the cache, so stored headers such as Access-Control-Allow-Origin
+    # were computed for the request's origin
+    return "\n".join(
+        (scope["path"], query, principal, headers.get("accept", ""), headers.get("origin", ""))
+    )
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve and store responses of :func:`cache_response` routes (see the module docstring).
+
+    Args:
+        app: ASGI application to wrap
+        cache: Cache to use (defaults to the process-wide ``response_cache``)
+    """
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache | None = None) -> None:
+        self.app = app
+        self.cache = response_cache if cache is None else cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+        elif scope["method"] == "GET":
+            await self._get(scope, receive, send)
+        else:
+            await self._write(scope, receive, send)
+
+    async def _write(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run a non-GET request, invalidating its tags once it has succeeded."""
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                # The route has committed by now; drop entries before the client can re-read
+                tags = getattr(scope.get("endpoint"), _INVALIDATES, None)
+                if tags:
+                    self.cache.invalidate(*tags)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _get(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer a GET from the cache, or run it and store a cacheable response."""
+        headers = Headers(scope=scope)
+        if "if-none-match" in headers or "if-modified-since" in headers:
+            await self.app(scope, receive, send)
+            return
+
+        key = cache_key(scope, headers)
+        if "no-cache" not in headers.get("cache-control", ""):
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.hits += 1
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": entry.status,
+                        "headers": [*entry.headers, (b"x-cache", b"HIT")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": entry.body})
+                return
+
+        generation = self.cache.generation
+        start: Message | None = None
+        stored_headers: list[tuple[bytes, bytes]] = []
+        body: bytes | None = None
+        ttl: float | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, stored_headers, body, ttl
+            if message["type"] == "http.response.start":
+                ttl = getattr(scope.get("endpoint"), _CACHE_TTL, None)
+                if ttl is not None:
+                    self.cache.misses += 1
+                    start = message
+                    stored_headers = list(message["headers"])
+                    MutableHeaders(raw=message["headers"]).append("X-Cache", "MISS")
+            elif message["type"] == "http.response.body" and start is not None:
+                if body is None and not message.get("more_body", False):
+                    body = message.get("body", b"")
+                else:
+                    # Streaming responses are never stored
+                    start = None
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if (
+            start is None
+            or body is None
+            or ttl is None
+            or start["status"] != 200
+            or "set-cookie" in Headers(raw=stored_headers)
+            or generation != self.cache.generation
+        ):
+            return
+        self.cache.set(
+            key,
+            CachedResponse(
+                status=start["status"],
+                headers=stored_headers,
+                body=body,
+                expires=time.monotonic() + ttl,
+                tags=getattr(scope.get("endpoint"), _CACHE_TAGS, frozenset()),
+            ),
+        )
@@ -1,10 +1,48 @@
 {% if cookiecutter.use_postgresql == "yes" -%}
 """Example SQLAlchemy model."""
 
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 
 from app.core.database import Base
 
+# Text search configuration used by the search vector
+SEARCH_CONFIG = "english"
+
+# Name matches rank above description matches (weights A and B)
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.name, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.description, '')), 'B')"
+)
+
+# Keeps search_vector current on every write. A trigger rather than a generated
+# column, so migration 004 could add it to a live table without rewriting it
+SEARCH_VECTOR_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION examples_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_EXPRESSION};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER examples_search_vector_update
+BEFORE INSERT OR UPDATE OF name, description ON examples
+FOR EACH ROW EXECUTE FUNCTION examples_search_vector_update()
+"""
+
 
 class Example(Base):
     """Example model demonstrating SQLAlchemy ORM."""
@@ -14,10 +52,51 @@ class Example(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, index=True)
     description = Column(Text, nullable=True)
+    # Row version for ETags, bumped by every write in app.crud.example
+    version = Column(Integer, nullable=False, server_default=text("1"))
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # Maintained by the examples_search_vector_update trigger; deferred so
+    # regular queries never fetch it
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
+    __table_args__ = (
+        # Supports keyset pagination ordered by (name, id)
+        Index("ix_examples_name_id", "name", "id"),
+        # Trigram indexes serving the substring (ILIKE '%term%') filters
+        Index(
+            "ix_examples_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_examples_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        Index("ix_examples_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     def __repr__(self) -> str:
         """String representation."""
         return f"<Example(id={self.id}, name='{self.name}')>"
+
+
+# The trigram operator classes must exist before metadata.create_all() builds the indexes
+event.listen(
+    Example.__table__,
+    "before_create",
+    # SQLAlchemy leaves DDL.__init__ unannotated
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),  # type: ignore[no-untyped-call]
+)
+for statement in (SEARCH_VECTOR_FUNCTION, SEARCH_VECTOR_TRIGGER):
+    event.listen(Example.__table__, "after_create", DDL(statement))  # type: ignore[no-untyped-call]
+event.listen(
+    Example.__table__,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS examples_search_vector_update()"),  # type: ignore[no-untyped-call]
+)
 {% else -%}
 """Models placeholder - PostgreSQL not enabled."""
 
@@ -1,5 +1,7 @@
 """Pydantic schemas for request/response validation."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -29,3 +31,51 @@ class ExampleResponse(ExampleBase):
     id: int = Field(..., description="Example ID")
 
     model_config = {"from_attributes": True}
+
+
+class ExampleSearchResult(ExampleResponse):
+    """Schema for a ranked full-text search hit."""
+
+    rank: float = Field(..., description="Relevance score (higher is better)")
+    snippet: str | None = Field(None, description="Matching excerpt with <mark> highlights")
+
+
+class ExampleBulkCreateResponse(BaseModel):
+    """Schema for the result of a bulk create."""
+
+    ids: list[int] = Field(..., description="IDs of the created examples, in request order")
+    count: int = Field(..., description="Number of examples created")
+
+
+class ExampleUpsert(ExampleBase):
+    """Schema for one row of a bulk upsert."""
+
+    id: int | None = Field(None, description="Example ID (rows without a key are inserted)")
+
+
+class ExampleUpsertResult(BaseModel):
+    """Outcome of upserting one row."""
+
+    id: int = Field(..., description="Example ID")
+    status: Literal["inserted", "updated"] = Field(..., description="What happened to the row")
+
+
+class ExampleBulkUpsertResponse(BaseModel):
+    """Schema for the result of a bulk upsert."""
+
+    results: list[ExampleUpsertResult] = Field(..., description="Per-row outcome, in request order")
+    inserted: int = Field(..., description="Number of rows inserted")
+    updated: int = Field(..., description="Number of rows updated")
+
+
+class ExampleBatchRequest(BaseModel):
+    """Schema for fetching many examples by ID."""
+
+    ids: list[int] = Field(..., min_length=1, description="Example IDs, in the order to return them")
+
+
+class ExampleBatchResponse(BaseModel):
+    """Schema for the result of a multi-get."""
+
+    items: list[ExampleResponse] = Field(..., description="Found examples, in request order")
+    missing: list[int] = Field(..., description="Requested IDs that do not exist")
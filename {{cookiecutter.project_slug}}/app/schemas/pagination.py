@@ -1,11 +1,21 @@
 """Pagination schemas for API responses."""
 
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
 
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
+# How the ``total`` of a paginated response was obtained:
+# exact (window count), estimated (planner statistics), cached (recent exact
+# count for the same filters) or none (not computed)
+TotalMode = Literal["exact", "estimated", "cached", "none"]
+
+# Shape of the items of a list response: one object per item (rows), or
+# ``columns`` plus one array per column under ``data`` (columnar), which
+# avoids repeating every key for every item on large pages
+Layout = Literal["rows", "columnar"]
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """
@@ -15,9 +25,27 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """
 
     items: list[T] = Field(..., description="List of items in current page")
-    total: int = Field(..., description="Total number of items across all pages")
+    total: int | None = Field(..., description="Total number of items across all pages")
     page: int = Field(..., description="Current page number (1-indexed)")
     size: int = Field(..., description="Number of items per page")
-    pages: int = Field(..., description="Total number of pages")
+    pages: int | None = Field(..., description="Total number of pages")
+    total_mode: TotalMode = Field("exact", description="How the total was obtained")
+
+    model_config = {"from_attributes": True}
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    Generic keyset (cursor) paginated response wrapper.
+
+    Cursors are opaque; pass ``next_cursor`` or ``prev_cursor`` back as the
+    ``cursor`` query parameter to move between pages. Every page costs the
+    same regardless of how deep it is.
+    """
+
+    items: list[T] = Field(..., description="List of items in current page")
+    size: int = Field(..., description="Maximum number of items per page")
+    next_cursor: str | None = Field(None, description="Cursor for the following page")
+    prev_cursor: str | None = Field(None, description="Cursor for the preceding page")
 
     model_config = {"from_attributes": True}
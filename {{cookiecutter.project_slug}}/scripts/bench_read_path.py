@@ -0,0 +1,115 @@
+{% if cookiecutter.use_postgresql == "yes" -%}
+"""Benchmark example reads: full ORM entities vs. Core column rows.
+
+The "orm" variant reproduces the previous read path: SELECT the Example
+entity, which builds instrumented instances in the session's identity map,
+then validate them into ExampleResponse. The "core" variant calls the
+current app.crud.example.get_examples, which selects just the response
+columns as plain rows. Both end with the same response models, so the
+difference is what the ORM layer costs per row.
+
+CPU time is process time (time spent waiting on PostgreSQL is excluded);
+allocations are the peak traced by tracemalloc while building one page.
+
+Usage:
+    python -m scripts.bench_read_path [repeat]
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal, engine
+from app.crud import example as crud
+from app.models.example import Example
+from app.schemas.example import ExampleResponse
+from scripts.seed_examples import connect, seed_examples
+
+PAGE_SIZES = (100, 1000)
+
+
+async def orm_page(db: AsyncSession, limit: int) -> list[ExampleResponse]:
+    """Load ORM entities and validate them into response models."""
+    result = await db.execute(select(Example).order_by(Example.id).limit(limit))
+    return [ExampleResponse.model_validate(example) for example in result.scalars().all()]
+
+
+async def core_page(db: AsyncSession, limit: int) -> list[ExampleResponse]:
+    """Load column rows through the CRUD layer and validate them into response models."""
+    rows = await crud.get_examples(db, limit=limit)
+    return [ExampleResponse.model_validate(row) for row in rows]
+
+
+VARIANTS: dict[str, Callable[[AsyncSession, int], Awaitable[Any]]] = {
+    "orm": orm_page,
+    "core": core_page,
+}
+
+
+async def measure(variant: str, limit: int, repeat: int) -> tuple[float, int]:
+    """Return (CPU microseconds per row, peak bytes allocated per row)."""
+    load = VARIANTS[variant]
+    async with AsyncSessionLocal() as db:
+        # Warm up connection, statement cache and compiled query cache
+        await load(db, limit)
+        db.expunge_all()
+
+        start = time.process_time()
+        for _ in range(repeat):
+            await load(db, limit)
+            # Start every page from an empty identity map, like a new request
+            db.expunge_all()
+        cpu = (time.process_time() - start) / (repeat * limit) * 1_000_000
+
+        tracemalloc.start()
+        try:
+            await load(db, limit)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        db.expunge_all()
+    return cpu, peak // limit
+
+
+async def run(repeat: int) -> None:
+    """Benchmark both variants per page size and print a comparison table."""
+    conn = await connect()
+    try:
+        await seed_examples(conn, max(PAGE_SIZES))
+    finally:
+        await conn.close()
+
+    print(f"{repeat} pages per measurement\n")
+    print(f"{'page':>6} {'variant':<8} {'CPU us/row':>11} {'bytes/row':>10}")
+    print("-" * 38)
+    for limit in PAGE_SIZES:
+        results = {variant: await measure(variant, limit, repeat) for variant in VARIANTS}
+        for variant, (cpu, allocated) in results.items():
+            print(f"{limit:>6} {variant:<8} {cpu:>11.2f} {allocated:>10}")
+        orm_cpu, orm_bytes = results["orm"]
+        core_cpu, core_bytes = results["core"]
+        print(f"{'':>6} {'saving':<8} {1 - core_cpu / orm_cpu:>10.0%} {1 - core_bytes / orm_bytes:>10.0%}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    """Main entry point."""
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    asyncio.run(run(repeat))
+
+
+if __name__ == "__main__":
+    main()
+{% else -%}
+"""Benchmark placeholder - PostgreSQL not enabled."""
+
+# Benchmarks disabled in this configuration
+# To enable, regenerate with use_postgresql=yes
+{% endif -%}
@@ -0,0 +1,97 @@
+{% if cookiecutter.use_redis == "yes" -%}
+"""Benchmark event-loop stalls caused by cache round trips, sync vs asyncio client.
+
+Concurrent tasks read the same cached value through the synchronous cache
+helper (``get_cache``, which blocks the event loop for every round trip) and
+then through its asyncio counterpart (``get_cache_async``). Meanwhile a probe
+task asks to wake up every millisecond and records how late it wakes: that
+lag is time the loop could not run anything else, e.g. other requests.
+
+Uses the Redis configured in .env.
+
+Usage:
+    python -m scripts.bench_redis_stall [requests] [concurrency]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.api.deps import async_redis_client, get_cache, get_cache_async, redis_client, set_cache
+
+KEY = "bench:stall"
+PROBE_INTERVAL = 0.001
+
+
+async def probe(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late each PROBE_INTERVAL sleep wakes up, in milliseconds."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected) * 1000)
+
+
+async def measure(
+    read: Callable[[], Awaitable[Any]],
+    requests: int,
+    concurrency: int,
+) -> tuple[float, list[float]]:
+    """Run ``requests`` reads from ``concurrency`` tasks; return reads/sec and probe lags."""
+    per_task = max(requests // concurrency, 1)
+
+    async def worker() -> None:
+        for _ in range(per_task):
+            await read()
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(PROBE_INTERVAL * 2)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await prober
+    return per_task * concurrency / elapsed, lags
+
+
+async def read_sync() -> Any:
+    """A cache read through the blocking helper, as an async route would call it."""
+    return get_cache(KEY)
+
+
+async def run(requests: int, concurrency: int) -> None:
+    """Benchmark both clients and print a comparison table."""
+    set_cache(KEY, {"id": 1, "name": "Example", "description": "x" * 200}, ttl=600)
+    print(f"{requests} cache reads, {concurrency} concurrent\n")
+    print(f"{'client':<8} {'reads/s':>9} {'max lag ms':>11} {'p99 lag ms':>11} {'stalled ms':>11}")
+    print("-" * 54)
+    for name, read in (("sync", read_sync), ("asyncio", lambda: get_cache_async(KEY))):
+        await measure(read, concurrency * 10, concurrency)  # warm-up, fills the pool
+        rate, lags = await measure(read, requests, concurrency)
+        p99 = statistics.quantiles(lags, n=100)[98] if len(lags) > 1 else max(lags, default=0)
+        print(f"{name:<8} {rate:>9.0f} {max(lags, default=0):>11.2f} {p99:>11.2f} {sum(lags):>11.0f}")
+
+    redis_client.delete(KEY)
+    await async_redis_client.aclose(close_connection_pool=True)
+
+
+def main() -> None:
+    """Main entry point."""
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    asyncio.run(run(requests, concurrency))
+
+
+if __name__ == "__main__":
+    main()
+{% else -%}
+"""Benchmark placeholder - Redis not enabled."""
+
+# Benchmarks disabled in this configuration
+# To enable, regenerate with use_redis=yes
+{% endif -%}
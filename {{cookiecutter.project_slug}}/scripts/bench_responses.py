@@ -0,0 +1,79 @@
+{% if cookiecutter.use_postgresql == "yes" -%}
+"""Benchmark list_examples requests/sec with and without FAST_RESPONSES.
+
+Requests go through the whole ASGI application in-process (httpx's ASGI
+transport), so routing, dependencies, the database query and response
+serialization are measured, but not sockets or an HTTP server. Both modes
+serve the same page of 100 examples from the database configured in .env.
+
+Usage:
+    python -m scripts.bench_responses [requests] [concurrency]
+"""
+
+import asyncio
+import sys
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.core.database import engine
+from app.main import app
+from scripts.seed_examples import connect, seed_examples
+
+PAGE_SIZE = 100
+URL = f"{settings.API_V1_STR}/example/?limit={PAGE_SIZE}"
+
+
+async def measure(client: httpx.AsyncClient, requests: int, concurrency: int) -> float:
+    """Send ``requests`` list requests from ``concurrency`` workers; return requests/sec."""
+    per_worker = max(requests // concurrency, 1)
+
+    async def worker() -> None:
+        for _ in range(per_worker):
+            response = await client.get(URL)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return per_worker * concurrency / (time.perf_counter() - start)
+
+
+async def run(requests: int, concurrency: int) -> None:
+    """Benchmark both response modes and print a comparison."""
+    conn = await connect()
+    try:
+        await seed_examples(conn, PAGE_SIZE)
+    finally:
+        await conn.close()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"GET {URL}: {requests} requests, {concurrency} concurrent\n")
+        results = {}
+        for fast in (False, True):
+            # Routes read the flag per request, so it can be flipped in-process
+            settings.FAST_RESPONSES = fast
+            await measure(client, concurrency * 5, concurrency)  # warm-up
+            results[fast] = await measure(client, requests, concurrency)
+            print(f"FAST_RESPONSES={str(fast).lower():<6} {results[fast]:>8.0f} req/s")
+        print(f"\nspeedup: {results[True] / results[False]:.2f}x")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    """Main entry point."""
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    asyncio.run(run(requests, concurrency))
+
+
+if __name__ == "__main__":
+    main()
+{% else -%}
+"""Benchmark placeholder - PostgreSQL not enabled."""
+
+# Benchmarks disabled in this configuration
+# To enable, regenerate with use_postgresql=yes
+{% endif -%}
@@ -0,0 +1,118 @@
+"""Benchmark application import time and time to first response.
+
+Import time comes from ``python -X importtime -c "import app.main"`` in a
+fresh interpreter: the total, and the packages whose own module code took
+longest. Time to first response starts uvicorn in a subprocess and polls
+``/health`` until it answers, so it covers interpreter start-up, imports and
+the lifespan warm-up. Both are the median of ``repeat`` runs.
+
+Pass budgets in milliseconds to exit with status 1 when a median exceeds
+them, so CI catches start-up regressions.
+
+Usage:
+    python -m scripts.bench_startup [repeat] [max_import_ms] [max_first_response_ms]
+"""
+
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+
+import httpx
+
+MODULE = "app.main"
+TOP_PACKAGES = 10
+SERVER_TIMEOUT = 60
+
+
+def import_times() -> tuple[float, Counter[str]]:
+    """
+    Import the application in a fresh interpreter.
+
+    Returns:
+        Cumulative milliseconds to import it, and the milliseconds spent in
+        each top-level package's own modules
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0.0
+    packages: Counter[str] = Counter()
+    # Lines look like "import time:  self [us] | cumulative | <indent>module"
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        own, cumulative, module = int(fields[0]), int(fields[1]), fields[2].strip()
+        packages[module.split(".")[0]] += own / 1000
+        if module == MODULE:
+            total = cumulative / 1000
+    return total, packages
+
+
+def free_port() -> int:
+    """A TCP port nothing listens on right now."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def first_response() -> float:
+    """Milliseconds from starting a server process until ``/health`` answers."""
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{MODULE}:app", "--port", str(port), "--log-level", "warning"],
+    )
+    try:
+        while time.perf_counter() - started < SERVER_TIMEOUT:
+            if server.poll() is not None:
+                raise RuntimeError(f"Server exited with status {server.returncode}")
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                    return (time.perf_counter() - started) * 1000
+            except httpx.TransportError:
+                time.sleep(0.01)
+        raise RuntimeError(f"Server did not answer within {SERVER_TIMEOUT}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    """Main entry point."""
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    max_import = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    max_first_response = float(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    runs = [import_times() for _ in range(repeat)]
+    import_ms = statistics.median(total for total, _ in runs)
+    print(f"import {MODULE}: {import_ms:.0f} ms (median of {repeat})\n")
+    print(f"{'package':<30} {'own import ms':>14}")
+    print("-" * 45)
+    for package, own in runs[-1][1].most_common(TOP_PACKAGES):
+        print(f"{package:<30} {own:>14.1f}")
+
+    first_response_ms = statistics.median(first_response() for _ in range(repeat))
+    print(f"\ntime to first response: {first_response_ms:.0f} ms (median of {repeat})")
+
+    over_budget = [
+        f"{name} {value:.0f} ms > {budget:.0f} ms"
+        for name, value, budget in (
+            ("import", import_ms, max_import),
+            ("first response", first_response_ms, max_first_response),
+        )
+        if budget is not None and value > budget
+    ]
+    if over_budget:
+        print("\nOver budget: " + ", ".join(over_budget))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
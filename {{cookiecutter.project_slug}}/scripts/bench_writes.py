@@ -0,0 +1,146 @@
+{% if cookiecutter.use_postgresql == "yes" -%}
+"""Benchmark example writes/sec: ORM round trips vs. single-statement RETURNING.
+
+The "orm" variant reproduces the previous CRUD layer: create adds, commits
+and refreshes the instance; update and delete SELECT the row first. The
+"returning" variant calls the current app.crud.example functions, which use
+INSERT/UPDATE/DELETE ... RETURNING. Each worker uses its own session, like
+concurrent requests would.
+
+Usage:
+    python -m scripts.bench_writes [operations] [concurrency]
+"""
+
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal, engine
+from app.crud import example as crud
+from app.models.example import Example
+from app.schemas.example import ExampleCreate, ExampleUpdate
+
+
+async def orm_create(db: AsyncSession, example: ExampleCreate) -> int:
+    """Create via add/commit/refresh."""
+    db_example = Example(name=example.name, description=example.description)
+    db.add(db_example)
+    await db.commit()
+    await db.refresh(db_example)
+    return int(db_example.id)
+
+
+async def orm_update(db: AsyncSession, example_id: int, example: ExampleUpdate) -> None:
+    """Update via SELECT, attribute assignment, commit and refresh."""
+    result = await db.execute(select(Example).where(Example.id == example_id))
+    db_example = result.scalar_one()
+    for field, value in example.model_dump(exclude_unset=True).items():
+        setattr(db_example, field, value)
+    await db.commit()
+    await db.refresh(db_example)
+
+
+async def orm_delete(db: AsyncSession, example_id: int) -> None:
+    """Delete via SELECT, session.delete and commit."""
+    result = await db.execute(select(Example).where(Example.id == example_id))
+    await db.delete(result.scalar_one())
+    await db.commit()
+
+
+async def returning_create(db: AsyncSession, example: ExampleCreate) -> int:
+    """Create via the CRUD layer (INSERT ... RETURNING)."""
+    return int((await crud.create_example(db, example)).id)
+
+
+async def returning_update(db: AsyncSession, example_id: int, example: ExampleUpdate) -> None:
+    """Update via the CRUD layer (UPDATE ... RETURNING)."""
+    await crud.update_example(db, example_id, example)
+
+
+async def returning_delete(db: AsyncSession, example_id: int) -> None:
+    """Delete via the CRUD layer (DELETE ... RETURNING)."""
+    await crud.delete_example(db, example_id)
+
+
+# (create, update, delete) implementations per variant
+Variant = tuple[
+    Callable[..., Awaitable[int]],
+    Callable[..., Awaitable[None]],
+    Callable[..., Awaitable[None]],
+]
+
+VARIANTS: dict[str, Variant] = {
+    "orm": (orm_create, orm_update, orm_delete),
+    "returning": (returning_create, returning_update, returning_delete),
+}
+
+
+async def worker(variant: str, operations: int, worker_id: int) -> dict[str, float]:
+    """Run create, update and delete phases and return seconds spent per phase."""
+    create, update_, delete_ = VARIANTS[variant]
+    timings = {}
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        ids = [
+            await create(db, ExampleCreate(name=f"bench {worker_id}-{i}", description="write benchmark"))
+            for i in range(operations)
+        ]
+        timings["create"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for example_id in ids:
+            await update_(db, example_id, ExampleUpdate(description="updated"))
+        timings["update"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for example_id in ids:
+            await delete_(db, example_id)
+        timings["delete"] = time.perf_counter() - start
+    return timings
+
+
+async def run(operations: int, concurrency: int) -> None:
+    """Benchmark both variants and print writes/sec per operation."""
+    per_worker = max(operations // concurrency, 1)
+    total = per_worker * concurrency
+    print(f"{total} writes per phase, {concurrency} concurrent sessions\n")
+    print(f"{'variant':<12} {'create/s':>10} {'update/s':>10} {'delete/s':>10}")
+    print("-" * 45)
+
+    for variant in VARIANTS:
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(worker(variant, per_worker, n) for n in range(concurrency))
+        )
+        # Workers run concurrently, so the slowest one bounds each phase
+        rates = {
+            phase: total / max(result[phase] for result in results)
+            for phase in ("create", "update", "delete")
+        }
+        print(
+            f"{variant:<12} {rates['create']:>10.0f} {rates['update']:>10.0f} "
+            f"{rates['delete']:>10.0f}   ({time.perf_counter() - start:.1f}s)"
+        )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    """Main entry point."""
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    asyncio.run(run(operations, concurrency))
+
+
+if __name__ == "__main__":
+    main()
+{% else -%}
+"""Benchmark placeholder - PostgreSQL not enabled."""
+
+# Benchmarks disabled in this configuration
+# To enable, regenerate with use_postgresql=yes
+{% endif -%}
@@ -0,0 +1,30 @@
+"""Write the OpenAPI document to a file, to serve it precomputed.
+
+Building the document generates the JSON schema of every model, which
+FastAPI otherwise does on the first request for it in every worker. Run this
+at build time and point ``OPENAPI_SCHEMA_FILE`` at the output; regenerate it
+whenever routes, models or settings that appear in the document change.
+
+Usage:
+    python -m scripts.export_openapi [path]
+"""
+
+import sys
+from pathlib import Path
+
+import orjson
+
+from app.main import app
+
+
+def main() -> None:
+    """Main entry point."""
+    path = Path(sys.argv[1] if len(sys.argv) > 1 else "openapi.json")
+    # Always regenerate, even if a previously exported file was loaded
+    app.openapi_schema = None
+    path.write_bytes(orjson.dumps(app.openapi()))
+    print(f"OpenAPI document written to {path}")
+
+
+if __name__ == "__main__":
+    main()
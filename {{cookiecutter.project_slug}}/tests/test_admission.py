@@ -0,0 +1,134 @@
+"""Unit tests for admission control and load shedding."""
+
+import asyncio
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import Settings
+from app.middleware.admission import AdmissionController, AdmissionMiddleware, route_priority
+
+
+def make_controller(**overrides: float) -> AdmissionController:
+    """Controller admitting one request at a time."""
+    options = {"max_in_flight": 1, "queue_timeout": 0.5, "target": 0.01, "interval": 0.1}
+    options.update(overrides)
+    return AdmissionController(**options)  # type: ignore[arg-type]
+
+
+async def test_waiters_are_admitted_in_order() -> None:
+    """Test queued requests get freed slots first come, first served."""
+    controller = make_controller()
+    assert await controller.acquire()
+    order: list[int] = []
+
+    async def request(number: int) -> None:
+        assert await controller.acquire()
+        order.append(number)
+        controller.release()
+
+    tasks = [asyncio.create_task(request(number)) for number in range(3)]
+    await asyncio.sleep(0)
+    assert controller.stats()["waiting"] == 3
+
+    controller.release()
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2]
+    assert controller.stats() == {
+        "in_flight": 0,
+        "waiting": 0,
+        "admitted": 4,
+        "queued": 3,
+        "shed": 0,
+    }
+
+
+async def test_wait_is_bounded() -> None:
+    """Test a request is shed when no slot frees up in time."""
+    controller = make_controller(queue_timeout=0.01)
+    assert await controller.acquire()
+    assert not await controller.acquire()
+    assert not await controller.acquire(wait=False)
+    assert controller.stats()["shed"] == 2
+    assert controller.stats()["waiting"] == 0
+
+    # The slot is still held by the first request only
+    controller.release()
+    assert controller.stats()["in_flight"] == 0
+
+
+async def test_standing_queue_shortens_waits() -> None:
+    """Test waits drop to the target once the queue has not drained for an interval."""
+    controller = make_controller(queue_timeout=10, target=0.01, interval=0.02)
+    assert await controller.acquire()
+    await asyncio.sleep(0.05)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    assert not await controller.acquire()
+    assert loop.time() - started < 1
+
+
+async def test_cancelled_waiter_passes_slot_on() -> None:
+    """Test a waiter cancelled while queued leaves the slot count intact."""
+    controller = make_controller()
+    assert await controller.acquire()
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+
+    controller.release()
+    assert controller.stats()["in_flight"] == 0
+    assert controller.stats()["waiting"] == 0
+
+
+def test_route_priority() -> None:
+    """Test path prefixes map to the configured priorities."""
+    assert route_priority("/health") == "critical"
+    assert route_priority("/api/v1/auth/login") == "critical"
+    assert route_priority("/api/v1/example/bulk") == "low"
+    assert route_priority("/api/v1/example/") == "normal"
+
+
+def test_admission_paths_follow_api_prefix() -> None:
+    """Test the default path prefixes move with API_V1_STR."""
+    settings = Settings(API_V1_STR="/api/v2")
+    assert settings.ADMISSION_CRITICAL_PATHS == ["/health", "/api/v2/auth"]
+    assert settings.ADMISSION_LOW_PRIORITY_PATHS == [
+        "/api/v2/example/export",
+        "/api/v2/example/bulk",
+    ]
+
+
+async def test_middleware_sheds_with_retry_after() -> None:
+    """Test overload gets 503 + Retry-After while critical paths still answer."""
+    controller = make_controller(queue_timeout=0.01)
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+    release = asyncio.Event()
+
+    @app.get("/slow")
+    async def slow() -> dict[str, bool]:
+        await release.wait()
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "healthy"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/slow"))
+        while controller.stats()["in_flight"] == 0:
+            await asyncio.sleep(0.001)
+
+        shed = await client.get("/slow")
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "1"
+
+        assert (await client.get("/health")).status_code == 200
+
+        release.set()
+        assert (await first).status_code == 200
+
+    assert controller.stats()["in_flight"] == 0
@@ -0,0 +1,118 @@
+"""Unit tests for bulk request body parsing."""
+
+import msgpack
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.bulk import bulk_body
+from app.core.config import settings
+from app.schemas.example import ExampleCreate
+
+app = FastAPI()
+
+
+@app.post("/bulk")
+async def bulk(items: list[ExampleCreate] = Depends(bulk_body(ExampleCreate))) -> list[str]:
+    """Echo the names of the parsed items."""
+    return [item.name for item in items]
+
+
+client = TestClient(app)
+
+
+def test_bulk_body_accepts_json_array() -> None:
+    """Test parsing a JSON array body."""
+    response = client.post("/bulk", json=[{"name": "a"}, {"name": "b", "description": "x"}])
+    assert response.status_code == 200
+    assert response.json() == ["a", "b"]
+
+
+def test_bulk_body_accepts_ndjson() -> None:
+    """Test parsing an NDJSON body, ignoring blank lines."""
+    response = client.post(
+        "/bulk",
+        content=b'{"name": "a"}\n\n{"name": "b"}\n',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.json() == ["a", "b"]
+
+
+def test_bulk_body_accepts_msgpack() -> None:
+    """Test parsing a MessagePack array body."""
+    response = client.post(
+        "/bulk",
+        content=msgpack.packb([{"name": "a"}, {"name": "b"}]),
+        headers={"Content-Type": "application/msgpack"},
+    )
+    assert response.status_code == 200
+    assert response.json() == ["a", "b"]
+
+
+def test_bulk_body_reports_item_errors_by_index() -> None:
+    """Test that validation errors point at the offending item."""
+    response = client.post("/bulk", json=[{"name": "ok"}, {"name": ""}])
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 1, "name"]
+
+
+def test_bulk_body_rejects_malformed_ndjson_line() -> None:
+    """Test that an unparsable NDJSON line is a validation error."""
+    response = client.post(
+        "/bulk",
+        content=b'{"name": "a"}\n{oops\n',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 2]
+
+
+def test_bulk_body_rejects_unknown_content_type() -> None:
+    """Test that unsupported content types are refused."""
+    response = client.post("/bulk", content=b"a", headers={"Content-Type": "text/plain"})
+    assert response.status_code == 415
+
+
+@pytest.mark.parametrize("content_type", ["application/json", "application/x-ndjson"])
+def test_bulk_body_enforces_item_ceiling(
+    monkeypatch: pytest.MonkeyPatch, content_type: str
+) -> None:
+    """Test that batches above BULK_MAX_ITEMS are rejected."""
+    monkeypatch.setattr(settings, "BULK_MAX_ITEMS", 2)
+    if content_type == "application/json":
+        body = b'[{"name": "a"}, {"name": "b"}, {"name": "c"}]'
+    else:
+        body = b'{"name": "a"}\n{"name": "b"}\n{"name": "c"}\n'
+    response = client.post("/bulk", content=body, headers={"Content-Type": content_type})
+    assert response.status_code == 413
+
+
+def test_bulk_body_enforces_body_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that oversized JSON bodies are rejected before parsing."""
+    monkeypatch.setattr(settings, "BULK_MAX_BODY_BYTES", 10)
+    response = client.post("/bulk", json=[{"name": "a long enough name"}])
+    assert response.status_code == 413
+
+
+def test_bulk_body_enforces_body_size_for_ndjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that streamed NDJSON bodies count against BULK_MAX_BODY_BYTES too."""
+    monkeypatch.setattr(settings, "BULK_MAX_BODY_BYTES", 20)
+    # A generator is sent chunked, without a Content-Length to check up front
+    lines = (b'{"name": "%s"}\n' % name for name in (b"a", b"b", b"c"))
+    response = client.post("/bulk", content=lines, headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 413
+
+
+@pytest.mark.parametrize("terminator", [b"", b"\n"])
+def test_bulk_body_enforces_ndjson_line_length(
+    monkeypatch: pytest.MonkeyPatch, terminator: bytes
+) -> None:
+    """Test that a single NDJSON line longer than BULK_MAX_LINE_BYTES is rejected."""
+    monkeypatch.setattr(settings, "BULK_MAX_LINE_BYTES", 32)
+    response = client.post(
+        "/bulk",
+        content=b'{"name": "a"}\n{"name": "' + b"x" * 64 + b'"}' + terminator,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 413
@@ -0,0 +1,121 @@
+"""Unit tests for the response compression middleware."""
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.types import Message
+
+from app.middleware.compression import CompressionMiddleware, choose_encoding, no_compression
+
+BODY = b"x" * 2048
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+
+@app.get("/large")
+async def large() -> Response:
+    """Return a body above the threshold."""
+    return Response(BODY, media_type="text/plain")
+
+
+@app.get("/tagged")
+async def tagged() -> Response:
+    """Return a large body with a strong ETag."""
+    return Response(BODY, media_type="text/plain", headers={"ETag": '"abc"'})
+
+
+@app.get("/small")
+async def small() -> Response:
+    """Return a body below the threshold."""
+    return Response(b"small", media_type="text/plain")
+
+
+@app.get("/opted-out")
+@no_compression
+async def opted_out() -> Response:
+    """Return a large body from a route that opted out."""
+    return Response(BODY, media_type="text/plain")
+
+
+client = TestClient(app)
+
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, None),
+        ("gzip", "gzip"),
+        ("gzip, zstd", "zstd"),
+        ("gzip, zstd;q=0.5", "gzip"),
+        ("*", "zstd"),
+        ("*, zstd;q=0", "gzip"),
+        ("identity", None),
+        ("gzip;q=0", None),
+    ],
+)
+def test_choose_encoding(accept_encoding: str | None, expected: str | None) -> None:
+    """Test the highest-quality supported encoding wins, ties by server preference."""
+    assert choose_encoding(accept_encoding, ["zstd", "gzip"]) == expected
+
+
+def test_compresses_large_bodies() -> None:
+    """Test a complete body above the threshold is gzipped with its new length."""
+    response = client.get("/large", headers=GZIP)
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(BODY)
+    assert response.content == BODY
+
+
+def test_weakens_strong_etags() -> None:
+    """Test a compressed body no longer claims the uncompressed bytes' strong ETag."""
+    assert client.get("/tagged", headers=GZIP).headers["etag"] == 'W/"abc"'
+    assert client.get("/tagged", headers={"Accept-Encoding": "identity"}).headers["etag"] == '"abc"'
+
+
+def test_skips_small_bodies_and_opted_out_routes() -> None:
+    """Test bodies under the threshold and opted-out routes are sent as-is."""
+    for path in ("/small", "/opted-out"):
+        response = client.get(path, headers=GZIP)
+        assert "content-encoding" not in response.headers
+
+
+async def test_compresses_streams_chunk_by_chunk() -> None:
+    """Test every streamed chunk is flushed so it decodes on arrival."""
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        # The client never disconnects
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    stream = StreamingResponse((b"chunk %d\n" % i for i in range(100)), media_type="text/plain")
+    await CompressionMiddleware(stream, minimum_size=1024)(scope, receive, send)
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decoder.decompress(bodies[0]["body"]) == b"chunk 0\n"
+    body = gzip.decompress(b"".join(message["body"] for message in bodies))
+    assert body == b"".join(b"chunk %d\n" % i for i in range(100))
@@ -0,0 +1,62 @@
+"""Unit tests for conditional GET helpers."""
+
+from datetime import datetime
+
+from starlette.requests import Request
+
+from app.api.conditional import etag, is_not_modified, not_modified, validator_headers
+from app.api.negotiation import response_msgpack
+
+MODIFIED = datetime.fromisoformat("2026-01-01T12:00:00.000500+00:00")
+
+
+def make_request(**headers: str) -> Request:
+    """Build a GET request with the given headers (underscores become dashes)."""
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_etag_is_strong_and_varies_with_inputs_and_encoding() -> None:
+    """Test tags are stable per inputs and differ per version and encoding."""
+    tag = etag(1, 3)
+    assert tag.startswith('"') and tag == etag(1, 3)
+    assert tag != etag(1, 4)
+
+    token = response_msgpack.set(True)
+    try:
+        assert etag(1, 3) != tag
+    finally:
+        response_msgpack.reset(token)
+
+
+def test_if_none_match() -> None:
+    """Test weak comparison, lists and the wildcard."""
+    tag = etag(1, 3)
+    assert is_not_modified(make_request(if_none_match=tag), tag)
+    assert is_not_modified(make_request(if_none_match=f'"other", W/{tag}'), tag)
+    assert is_not_modified(make_request(if_none_match="*"), tag)
+    assert not is_not_modified(make_request(if_none_match='"other"'), tag)
+    assert not is_not_modified(make_request(), tag)
+
+
+def test_if_modified_since() -> None:
+    """Test second-resolution dates, and that If-None-Match takes precedence."""
+    tag = etag(1, 3)
+    current = validator_headers(tag, MODIFIED)["Last-Modified"]
+    assert current == "Thu, 01 Jan 2026 12:00:00 GMT"
+    assert is_not_modified(make_request(if_modified_since=current), tag, MODIFIED)
+    assert not is_not_modified(
+        make_request(if_modified_since="Thu, 01 Jan 2026 11:59:59 GMT"), tag, MODIFIED
+    )
+    assert not is_not_modified(make_request(if_modified_since="garbage"), tag, MODIFIED)
+    assert not is_not_modified(
+        make_request(if_none_match='"other"', if_modified_since=current), tag, MODIFIED
+    )
+
+
+def test_not_modified_has_no_body() -> None:
+    """Test the 304 carries the validators but no body."""
+    response = not_modified(validator_headers('"abc"'))
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
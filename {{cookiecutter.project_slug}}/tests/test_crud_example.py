@@ -0,0 +1,111 @@
+{% if cookiecutter.use_postgresql == "yes" -%}
+"""Unit tests for example CRUD helpers that need no database."""
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.crud import example as crud
+from app.models.example import Example
+from app.schemas.example import ExampleUpdate
+
+
+class FakeResult:
+    """The parts of a SQLAlchemy result the helpers read."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+
+    def all(self) -> list[Any]:
+        return self.rows
+
+    def one_or_none(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+    def scalar_one_or_none(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+
+class FakeSession:
+    """Answers each execute() with the next queued result."""
+
+    def __init__(self, *results: list[Any]) -> None:
+        self.results = [FakeResult(rows) for rows in results]
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any, *args: Any) -> FakeResult:
+        self.statements.append(statement)
+        return self.results.pop(0)
+
+    async def commit(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def empty_count_cache() -> Iterator[None]:
+    """Start and end every test with an empty count cache."""
+    crud.invalidate_count_cache()
+    yield
+    crud.invalidate_count_cache()
+
+
+def page(total: int) -> list[Any]:
+    """Rows of a page query carrying ``count(*) OVER()``."""
+    return [SimpleNamespace(id=1, total=total)]
+
+
+async def test_updating_a_filtered_column_invalidates_cached_totals() -> None:
+    """Test a renamed row is reflected in the next cached filtered total."""
+
+    async def cached_total(db: FakeSession) -> int | None:
+        _, total, _ = await crud.get_examples_page(db, name="Alpha", total_mode="cached")
+        return total
+
+    # The first request counts, the second is served from the cache
+    assert await cached_total(FakeSession(page(3))) == 3
+    assert await cached_total(FakeSession(page(99))) == 3
+
+    renamed = SimpleNamespace(id=1, name="Beta")
+    await crud.update_example(FakeSession([renamed]), 1, ExampleUpdate(name="Beta"))
+    assert await cached_total(FakeSession(page(2))) == 2
+
+
+async def test_update_of_missing_row_keeps_cached_totals() -> None:
+    """Test an update matching no row leaves the count cache alone."""
+    await crud.get_examples_page(FakeSession(page(3)), name="Alpha", total_mode="cached")
+    await crud.update_example(FakeSession([]), 1, ExampleUpdate(name="Beta"))
+    _, total, _ = await crud.get_examples_page(
+        FakeSession(page(99)), name="Alpha", total_mode="cached"
+    )
+    assert total == 3
+
+
+@pytest.mark.parametrize(("reltuples", "expected"), [(-1, None), (0, None), (1234, 1234)])
+async def test_unfiltered_estimate_ignores_unanalyzed_tables(
+    reltuples: int, expected: int | None
+) -> None:
+    """Test -1 (PostgreSQL 14+) and 0 (older servers) are not reported as totals."""
+    assert await crud._estimate_examples(FakeSession([reltuples]), []) == expected
+
+
+def test_explain_keeps_bound_parameters() -> None:
+    """Test EXPLAIN wraps the statement and still sends its parameters."""
+    statement = select(Example.id).where(Example.name == "Alpha", Example.id > 10)
+    compiled = crud._Explain(statement).compile(dialect=asyncpg.dialect())
+
+    sql = str(compiled)
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT examples.id")
+    assert "$1" in sql
+    assert "$2" in sql
+    assert "Alpha" not in sql
+    assert list(compiled.params.values()) == ["Alpha", 10]
+{% else -%}
+"""Example CRUD tests (database not enabled)."""
+
+# CRUD tests are only available when PostgreSQL is enabled
+# To enable, regenerate the project with use_postgresql=yes
+{% endif -%}
@@ -0,0 +1,63 @@
+"""Unit tests for export row encoders."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from app.api.export import ArrowStreamEncoder, arrow_available, encode_csv, encode_ndjson
+
+COLUMNS = ("id", "name", "description")
+ROWS = [(1, "First", None), (2, 'Quote "and", comma', "Line\nbreak")]
+
+
+def test_encode_ndjson_one_object_per_line() -> None:
+    """Test NDJSON output has one JSON object per row."""
+    lines = encode_ndjson(COLUMNS, ROWS).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "name": "First", "description": None},
+        {"id": 2, "name": 'Quote "and", comma', "description": "Line\nbreak"},
+    ]
+
+
+def test_encode_ndjson_empty() -> None:
+    """Test encoding no rows yields no bytes."""
+    assert encode_ndjson(COLUMNS, []) == b""
+
+
+def test_encode_csv_round_trips() -> None:
+    """Test CSV output with header is readable back, including quoting."""
+    body = encode_csv(COLUMNS, ROWS, header=True) + encode_csv(COLUMNS, ROWS[:1])
+    records = list(csv.reader(io.StringIO(body.decode())))
+    assert records[0] == list(COLUMNS)
+    assert records[1:] == [
+        ["1", "First", ""],
+        ["2", 'Quote "and", comma', "Line\nbreak"],
+        ["1", "First", ""],
+    ]
+
+
+@pytest.mark.skipif(not arrow_available(), reason="pyarrow not installed")
+def test_arrow_stream_round_trips() -> None:
+    """Test chunks encoded separately read back as one Arrow table."""
+    import pyarrow as pa
+
+    encoder = ArrowStreamEncoder([("id", "int64"), ("name", "string"), ("description", "string")])
+    body = encoder.encode(ROWS) + encoder.encode([]) + encoder.encode(ROWS[:1]) + encoder.close()
+
+    table = pa.ipc.open_stream(body).read_all()
+    assert table.column_names == list(COLUMNS)
+    assert table.column("id").to_pylist() == [1, 2, 1]
+    assert table.column("description").to_pylist() == [None, "Line\nbreak", None]
+
+
+@pytest.mark.skipif(not arrow_available(), reason="pyarrow not installed")
+def test_arrow_stream_without_rows_has_schema() -> None:
+    """Test an empty export is still a valid stream carrying the schema."""
+    import pyarrow as pa
+
+    encoder = ArrowStreamEncoder([("id", "int64")])
+    table = pa.ipc.open_stream(encoder.close()).read_all()
+    assert table.num_rows == 0
+    assert table.schema.names == ["id"]
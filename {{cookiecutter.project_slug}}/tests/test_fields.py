@@ -0,0 +1,49 @@
+"""Unit tests for sparse fieldsets."""
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.fields import Fields, json_response, partial_model, sparse_fields
+from app.schemas.example import ExampleResponse
+
+app = FastAPI()
+
+
+@app.get("/fields")
+async def selected(fields: Fields | None = Depends(sparse_fields(ExampleResponse))) -> list[str] | None:
+    """Echo the selected fields."""
+    return list(fields) if fields is not None else None
+
+
+client = TestClient(app)
+
+
+def test_sparse_fields_absent_means_all() -> None:
+    """Test omitting the parameter selects every field."""
+    assert client.get("/fields").json() is None
+
+
+def test_sparse_fields_adds_id_and_keeps_model_order() -> None:
+    """Test the selection always includes id and follows the model's field order."""
+    response = client.get("/fields", params={"fields": "name, id,name"})
+    assert response.json() == ["name", "id"]
+
+
+def test_sparse_fields_rejects_unknown() -> None:
+    """Test unknown fields are reported."""
+    response = client.get("/fields", params={"fields": "name,secret"})
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
+
+
+def test_partial_model_is_cached_and_restricted() -> None:
+    """Test partial models keep only the selected fields and are reused."""
+    model = partial_model(ExampleResponse, ("name", "id"))
+    assert model is partial_model(ExampleResponse, ("name", "id"))
+    assert partial_model(ExampleResponse, None) is ExampleResponse
+
+    item = model.model_validate(ExampleResponse(id=1, name="a", description="long text"))
+    assert item.model_dump() == {"name": "a", "id": 1}
+    response = json_response(item)
+    assert response.body == b'{"name":"a","id":1}'
+    assert response.headers["vary"] == "Accept"
@@ -1,14 +1,21 @@
 {% if cookiecutter.use_postgresql == "yes" -%}
 """End-to-end integration tests with database."""
 
+from collections.abc import AsyncIterator
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_session_factory
+from app.core.pagination import encode_cursor
+from app.crud.example import invalidate_count_cache
 from app.main import app
+from app.middleware.response_cache import response_cache
 from app.models.example import Example
 
 # Create test database engine
@@ -16,9 +23,23 @@ SQLALCHEMY_TEST_DATABASE_URL = settings.DATABASE_URL.replace(
     "/{{ cookiecutter.database_name }}", "/{{ cookiecutter.database_name }}_test"
 )
 
-engine = create_engine(SQLALCHEMY_TEST_DATABASE_URL)
+# Tests seed and inspect rows through a synchronous session (psycopg)...
+engine = create_engine(
+    make_url(SQLALCHEMY_TEST_DATABASE_URL).set(drivername="postgresql+psycopg")
+)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# ...while the application runs on asyncpg, as in production. Every TestClient
+# runs the app on its own event loop, and asyncpg connections cannot move
+# between loops, so connections are not pooled.
+async_engine = create_async_engine(
+    make_url(SQLALCHEMY_TEST_DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    poolclass=NullPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
 @pytest.fixture(scope="function")
 def db_session() -> Session:
@@ -37,14 +58,17 @@ def db_session() -> Session:
 
 @pytest.fixture(scope="function")
 def client(db_session: Session) -> TestClient:
-    """Create a test client with database dependency override."""
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-    
+    """Create a test client whose requests use async sessions on the test database."""
+
+    async def override_get_db() -> AsyncIterator[AsyncSession]:
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingAsyncSessionLocal
+    # Tables are recreated per test, so responses and counts cached by earlier tests are stale
+    response_cache.clear()
+    invalidate_count_cache()
     
     with TestClient(app) as test_client:
         yield test_client
@@ -182,6 +206,317 @@ def test_concurrent_database_operations(client: TestClient, db_session: Session)
     for example_id in created_ids:
         response = client.get(f"/api/v1/example/{example_id}")
         assert response.status_code == 200
+
+
+def test_cursor_pagination_walks_all_pages(client: TestClient, db_session: Session) -> None:
+    """Test walking keyset pages forwards and back again."""
+    for i in range(5):
+        db_session.add(Example(name=f"Example {i}", description=f"Description {i}"))
+    db_session.commit()
+
+    # Walk forwards two items at a time
+    seen = []
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "sort": "name"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/example/cursor", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        pages.append(page)
+        seen.extend(item["name"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"Example {i}" for i in range(5)]
+    assert pages[0]["prev_cursor"] is None
+
+    # Step back from the last page
+    response = client.get(
+        "/api/v1/example/cursor",
+        params={"limit": 2, "sort": "name", "cursor": pages[-1]["prev_cursor"]},
+    )
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]] == ["Example 2", "Example 3"]
+
+
+def test_cursor_pagination_rejects_invalid_cursor(client: TestClient) -> None:
+    """Test that a malformed cursor is a client error."""
+    response = client.get("/api/v1/example/cursor", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+def test_cursor_pagination_rejects_cursor_with_wrong_key_types(client: TestClient) -> None:
+    """Test that a well-formed cursor whose key does not fit the sort is a client error."""
+    cursor = encode_cursor("name", [1, "Example 1"])
+    response = client.get("/api/v1/example/cursor", params={"sort": "name", "cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_list_examples_enforces_max_limit(client: TestClient) -> None:
+    """Test that page sizes above PAGINATION_MAX_LIMIT are rejected."""
+    response = client.get(
+        "/api/v1/example/", params={"limit": settings.PAGINATION_MAX_LIMIT + 1}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("total_mode", ["exact", "estimated", "cached", "none"])
+def test_list_examples_total_modes(
+    client: TestClient, db_session: Session, total_mode: str
+) -> None:
+    """Test that every totals strategy returns the page and reports its mode."""
+    for i in range(3):
+        db_session.add(Example(name=f"Example {i}", description=f"Description {i}"))
+    db_session.commit()
+
+    response = client.get("/api/v1/example/", params={"limit": 2, "total_mode": total_mode})
+    assert response.status_code == 200
+    page = response.json()
+    assert len(page["items"]) == 2
+    if total_mode == "none":
+        assert page["total"] is None
+        assert page["pages"] is None
+        assert page["total_mode"] == "none"
+    else:
+        assert page["total"] is not None
+        assert page["total_mode"] in ("exact", "estimated", "cached")
+    if total_mode == "exact":
+        assert page["total"] == 3
+        assert page["pages"] == 2
+
+
+def test_list_examples_without_total(client: TestClient) -> None:
+    """Test that include_total=false skips the count."""
+    response = client.get("/api/v1/example/", params={"include_total": "false"})
+    assert response.status_code == 200
+    assert response.json()["total_mode"] == "none"
+
+
+def test_search_examples_ranks_and_highlights(client: TestClient, db_session: Session) -> None:
+    """Test full-text search ranking, snippets and exclusions."""
+    db_session.add_all([
+        Example(name="Postgres tuning", description="Indexes make queries fast"),
+        Example(name="Gardening", description="Tuning the soil for tomatoes"),
+        Example(name="Cooking", description="Nothing relevant here"),
+    ])
+    db_session.commit()
+
+    response = client.get("/api/v1/example/search", params={"q": "tuning"})
+    assert response.status_code == 200
+    page = response.json()
+    assert page["total"] == 2
+    # Name matches carry a higher weight than description matches
+    assert page["items"][0]["name"] == "Postgres tuning"
+    assert page["items"][0]["rank"] >= page["items"][1]["rank"]
+    assert "<mark>" in page["items"][1]["snippet"]
+
+    response = client.get("/api/v1/example/search", params={"q": "tuning -tomatoes"})
+    assert [item["name"] for item in response.json()["items"]] == ["Postgres tuning"]
+
+
+@pytest.mark.parametrize("count", [3, settings.BULK_COPY_THRESHOLD])
+def test_bulk_create_examples(client: TestClient, db_session: Session, count: int) -> None:
+    """Test bulk creation through both the INSERT and the COPY path."""
+    payload = [{"name": f"Bulk {i}", "description": f"Row {i}"} for i in range(count)]
+
+    response = client.post("/api/v1/example/bulk", json=payload)
+    assert response.status_code == 201
+    ids = response.json()["ids"]
+    assert len(ids) == count
+
+    # IDs come back in request order
+    rows = {row.id: row.name for row in db_session.query(Example).all()}
+    assert [rows[example_id] for example_id in ids] == [item["name"] for item in payload]
+
+
+def test_bulk_upsert_examples(client: TestClient, db_session: Session) -> None:
+    """Test bulk upsert reports inserted and updated rows in request order."""
+    existing = Example(name="Old name", description="Old description")
+    db_session.add(existing)
+    db_session.commit()
+
+    payload = [
+        {"name": "New row", "description": "Inserted"},
+        {"id": existing.id, "name": "First rename", "description": None},
+        {"id": existing.id, "name": "Renamed", "description": "Updated"},
+        # The ID the sequence would hand out next
+        {"id": existing.id + 1, "name": "Explicit ID"},
+    ]
+    response = client.put("/api/v1/example/bulk", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert [result["status"] for result in data["results"]] == ["inserted", "updated", "updated", "inserted"]
+    assert data["inserted"] == 2
+    assert data["updated"] == 2
+
+    db_session.expire_all()
+    assert db_session.get(Example, existing.id).name == "Renamed"
+
+    # New rows keep getting fresh IDs after explicit ones
+    response = client.post("/api/v1/example/", json={"name": "After upsert"})
+    assert response.status_code == 201
+
+
+def test_bulk_upsert_natural_key_not_configured(client: TestClient) -> None:
+    """Test upserting on the natural key requires it to be configured."""
+    response = client.put("/api/v1/example/bulk?key=natural", json=[{"name": "x"}])
+    assert response.status_code == 400
+
+
+def test_get_examples_batch(client: TestClient, db_session: Session) -> None:
+    """Test multi-get preserves request order and reports missing IDs."""
+    first = Example(name="First", description=None)
+    second = Example(name="Second", description=None)
+    db_session.add_all([first, second])
+    db_session.commit()
+    missing_id = second.id + 1000
+
+    response = client.get(
+        "/api/v1/example/batch",
+        params={"ids": [second.id, missing_id, first.id, second.id]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data["items"]] == ["Second", "First"]
+    assert data["missing"] == [missing_id]
+
+    response = client.post("/api/v1/example/batch", json={"ids": [first.id, missing_id]})
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == [first.id]
+
+    too_many = list(range(settings.BATCH_MAX_IDS + 1))
+    response = client.post("/api/v1/example/batch", json={"ids": too_many})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+def test_export_examples_streams_all_rows(
+    client: TestClient, db_session: Session, export_format: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test export streams every matching row across several chunks."""
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 4)
+    db_session.add_all([Example(name=f"Export {i:02d}", description="row") for i in range(10)])
+    db_session.add(Example(name="Other", description="row"))
+    db_session.commit()
+
+    # The export opens its own session after the request's one is closed
+    export_engine = create_async_engine(SQLALCHEMY_TEST_DATABASE_URL)
+    app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+        export_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    response = client.get(
+        "/api/v1/example/export", params={"format": export_format, "name": "Export"}
+    )
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    if export_format == "csv":
+        assert lines[0] == "id,name,description"
+        lines = lines[1:]
+    assert len(lines) == 10
+    assert "Export 09" in lines[-1]
+
+
+def test_export_examples_as_arrow(client: TestClient, db_session: Session) -> None:
+    """Test Arrow export yields a readable IPC stream with typed columns."""
+    pa = pytest.importorskip("pyarrow")
+    db_session.add_all([Example(name=f"Arrow {i}", description=None) for i in range(3)])
+    db_session.commit()
+
+    export_engine = create_async_engine(SQLALCHEMY_TEST_DATABASE_URL)
+    app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+        export_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    response = client.get("/api/v1/example/export", params={"format": "arrow"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column_names == ["id", "name", "description"]
+    assert table.column("name").to_pylist() == ["Arrow 0", "Arrow 1", "Arrow 2"]
+
+
+def test_sparse_fieldsets(client: TestClient, db_session: Session) -> None:
+    """Test ?fields= narrows list, cursor and single-item responses."""
+    example = Example(name="Narrow", description="A long description")
+    db_session.add(example)
+    db_session.commit()
+
+    response = client.get("/api/v1/example/", params={"fields": "name"})
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": example.id, "name": "Narrow"}]
+
+    response = client.get("/api/v1/example/cursor", params={"fields": "id", "sort": "name"})
+    assert response.json()["items"] == [{"id": example.id}]
+
+    response = client.get(f"/api/v1/example/{example.id}", params={"fields": "description"})
+    assert response.json() == {"id": example.id, "description": "A long description"}
+
+    response = client.get("/api/v1/example/", params={"fields": "name,unknown"})
+    assert response.status_code == 400
+
+
+def test_conditional_get(client: TestClient, db_session: Session) -> None:
+    """Test ETags revalidate to 304 until the example is updated."""
+    example = Example(name="Cached")
+    db_session.add(example)
+    db_session.commit()
+    url = f"/api/v1/example/{example.id}"
+
+    response = client.get(url)
+    tag = response.headers["etag"]
+    assert "last-modified" in response.headers
+
+    response = client.get(url, headers={"If-None-Match": tag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    list_tag = client.get("/api/v1/example/").headers["etag"]
+    assert client.get("/api/v1/example/", headers={"If-None-Match": list_tag}).status_code == 304
+
+    client.put(url, json={"name": "Changed"})
+    response = client.get(url, headers={"If-None-Match": tag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != tag
+    assert client.get("/api/v1/example/", headers={"If-None-Match": list_tag}).status_code == 200
+
+
+def test_response_cache_invalidated_by_writes(client: TestClient, db_session: Session) -> None:
+    """Test cached example reads are served until an example write drops them."""
+    example = Example(name="Hot")
+    db_session.add(example)
+    db_session.commit()
+    url = f"/api/v1/example/{example.id}"
+
+    assert client.get(url).headers["x-cache"] == "MISS"
+    assert client.get(url).headers["x-cache"] == "HIT"
+
+    client.put(url, json={"name": "Updated"})
+    response = client.get(url)
+    assert response.headers["x-cache"] == "MISS"
+    assert response.json()["name"] == "Updated"
+
+
+def test_columnar_layout(client: TestClient, db_session: Session) -> None:
+    """Test ?layout=columnar returns one array per column with the page metadata."""
+    db_session.add_all([Example(name=f"Column {i}") for i in range(3)])
+    db_session.commit()
+
+    response = client.get("/api/v1/example/", params={"layout": "columnar", "fields": "name"})
+    assert response.status_code == 200
+    body = response.json()
+    assert "items" not in body
+    assert body["columns"] == ["name", "id"]
+    assert body["data"]["name"] == ["Column 0", "Column 1", "Column 2"]
+    assert body["total"] == 3
+
+    response = client.get("/api/v1/example/cursor", params={"layout": "columnar", "limit": 2})
+    assert len(response.json()["data"]["id"]) == 2
+    assert response.json()["next_cursor"] is not None
 {% else -%}
 """End-to-end integration tests (database not enabled)."""
 
@@ -0,0 +1,36 @@
+"""Unit tests for application warm-up."""
+
+import pytest
+
+from app.lifespan import warm_up
+
+
+async def test_warm_up_times_each_step() -> None:
+    """Test every step runs in order and gets a timing."""
+    ran: list[str] = []
+
+    async def first() -> None:
+        ran.append("first")
+
+    async def second() -> None:
+        ran.append("second")
+
+    timings = await warm_up({"first": first, "second": second})
+    assert ran == ["first", "second"]
+    assert list(timings) == ["first", "second"]
+    assert all(timing is not None and timing >= 0 for timing in timings.values())
+
+
+async def test_failing_step_is_skipped(caplog: pytest.LogCaptureFixture) -> None:
+    """Test a failing step is logged and does not stop the warm-up."""
+
+    async def broken() -> None:
+        raise ConnectionError("database unavailable")
+
+    async def fine() -> None:
+        pass
+
+    timings = await warm_up({"broken": broken, "fine": fine})
+    assert timings["broken"] is None
+    assert timings["fine"] is not None
+    assert "Warm-up step 'broken' failed" in caplog.text
@@ -0,0 +1,87 @@
+"""Unit tests for MessagePack content negotiation."""
+
+import msgpack
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.negotiation import NegotiatedRoute, prefers_msgpack
+from app.api.responses import NegotiatedResponse
+from app.schemas.example import ExampleCreate, ExampleResponse
+
+router = APIRouter(route_class=NegotiatedRoute)
+
+
+@router.post("/examples", response_model=ExampleResponse)
+async def create(example_in: ExampleCreate) -> ExampleResponse:
+    """Echo the created example with an id."""
+    return ExampleResponse(id=1, **example_in.model_dump())
+
+
+@router.get("/missing")
+async def missing() -> None:
+    """Always fail, to check error responses."""
+    raise HTTPException(status_code=404, detail="Not found")
+
+
+app = FastAPI(default_response_class=NegotiatedResponse)
+app.include_router(router)
+client = TestClient(app)
+
+MSGPACK = {"Accept": "application/msgpack"}
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, False),
+        ("application/json", False),
+        ("application/msgpack", True),
+        ("application/x-msgpack, application/json;q=0.5", True),
+        ("application/json, application/msgpack;q=0.9", False),
+        ("application/msgpack;q=0", False),
+        ("*/*", False),
+    ],
+)
+def test_prefers_msgpack(accept: str | None, expected: bool) -> None:
+    """Test Accept headers are compared by quality."""
+    assert prefers_msgpack(accept) is expected
+
+
+def test_json_is_the_default() -> None:
+    """Test responses stay JSON without an Accept preference."""
+    response = client.post("/examples", json={"name": "a"})
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["vary"] == "Accept"
+    assert response.json() == {"name": "a", "description": None, "id": 1}
+
+
+def test_msgpack_response_and_body() -> None:
+    """Test a MessagePack body is validated and answered in MessagePack."""
+    response = client.post(
+        "/examples",
+        content=msgpack.packb({"name": "a", "description": "d"}),
+        headers={"Content-Type": "application/msgpack", **MSGPACK},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == {"name": "a", "description": "d", "id": 1}
+
+
+def test_msgpack_body_validation_errors() -> None:
+    """Test invalid and malformed MessagePack bodies are 422s."""
+    headers = {"Content-Type": "application/msgpack"}
+    invalid = client.post("/examples", content=msgpack.packb({"name": ""}), headers=headers)
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"][0]["loc"] == ["body", "name"]
+
+    malformed = client.post("/examples", content=b"\xc1", headers=headers)
+    assert malformed.status_code == 422
+    assert malformed.json()["detail"][0]["type"] == "msgpack_invalid"
+
+
+def test_errors_stay_json() -> None:
+    """Test exception handler responses are not negotiated."""
+    response = client.get("/missing", headers=MSGPACK)
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Not found"}
@@ -0,0 +1,53 @@
+"""Unit tests for keyset pagination cursors."""
+
+import pytest
+
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    """Test that a cursor decodes to the key it was built from."""
+    cursor = encode_cursor("name", ["Example 1", 42])
+    assert decode_cursor(cursor, "name") == (["Example 1", 42], False)
+
+
+def test_cursor_is_url_safe() -> None:
+    """Test that cursors can be passed as query parameters unescaped."""
+    cursor = encode_cursor("name", ["???>>>", 1], backwards=True)
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+    assert decode_cursor(cursor, "name") == (["???>>>", 1], True)
+
+
+def test_cursor_rejects_other_sort() -> None:
+    """Test that a cursor cannot be reused with a different sort mode."""
+    cursor = encode_cursor("id", [10])
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "name")
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", "e30"])
+def test_cursor_rejects_garbage(cursor: str) -> None:
+    """Test that malformed cursors raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "id")
+
+
+@pytest.mark.parametrize(
+    ("sort", "key"),
+    [
+        ("id", ["10"]),
+        ("id", [10, 11]),
+        ("id", [True]),
+        ("id", [None]),
+        ("name", [1, 2]),
+        ("name", ["Example 1"]),
+        ("name", ["Example 1", "42"]),
+        ("name", ["Example 1", 42, 43]),
+    ],
+)
+def test_cursor_rejects_key_not_matching_sort(sort: str, key: list[object]) -> None:
+    """Test that a cursor's key must have the types of the sort's columns."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(sort, key), sort)
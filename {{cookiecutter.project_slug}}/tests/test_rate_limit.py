@@ -0,0 +1,154 @@
+"""Unit tests for rate limiting."""
+
+{% if cookiecutter.use_redis == "yes" -%}
+import asyncio
+
+import redis
+{% endif -%}
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.rate_limit import {% if cookiecutter.use_redis == "yes" %}Decision, {% endif %}LocalTokenBuckets, RateLimiter, rate_limit
+{%- if cookiecutter.include_auth == "yes" %}
+from app.core.security import create_access_token
+{%- endif %}
+
+
+def test_local_bucket_allows_burst_then_limits() -> None:
+    """Test a bucket allows ``limit`` calls at once, then asks to wait."""
+    buckets = LocalTokenBuckets(max_keys=10)
+    decisions = [buckets.hit("client", limit=3, period=60) for _ in range(4)]
+    assert [decision.allowed for decision in decisions] == [True, True, True, False]
+    assert [decision.remaining for decision in decisions[:3]] == [2, 1, 0]
+    # One token refills every 20 seconds
+    assert 19 < decisions[3].retry_after <= 20
+
+    # Other keys have their own bucket
+    assert buckets.hit("other", limit=3, period=60).allowed
+
+
+def test_local_buckets_are_bounded() -> None:
+    """Test only the most recently used buckets are kept."""
+    buckets = LocalTokenBuckets(max_keys=2)
+    buckets.hit("a", limit=1, period=60)
+    buckets.hit("b", limit=1, period=60)
+    buckets.hit("c", limit=1, period=60)
+    # "a" was forgotten, so it starts with a full bucket again
+    assert buckets.hit("a", limit=1, period=60).allowed
+    assert not buckets.hit("c", limit=1, period=60).allowed
+
+
+def limited_app(limiter: RateLimiter) -> FastAPI:
+    """Build an app with two routes sharing a limit of 2 calls per minute."""
+    app = FastAPI()
+    limited = Depends(rate_limit(2, 60, limiter=limiter))
+
+    @app.post("/items/{item_id}", dependencies=[limited])
+    async def touch(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    @app.post("/tasks", dependencies=[limited])
+    async def task() -> dict[str, str]:
+        return {"status": "queued"}
+
+    return app
+
+
+def test_dependency_limits_per_principal_and_route() -> None:
+    """Test the dependency answers 429 with Retry-After once a client's bucket is empty."""
+    app = limited_app(RateLimiter(local=LocalTokenBuckets(max_keys=10)))
+    client = TestClient(app)
+    first = client.post("/items/1")
+    assert first.status_code == 200
+    assert first.headers["RateLimit-Remaining"] == "1"
+    # Path parameters share the route's bucket
+    assert client.post("/items/2").status_code == 200
+
+    limited_response = client.post("/items/3")
+    assert limited_response.status_code == 429
+    assert limited_response.headers["Retry-After"] == "30"
+
+    # Another route, and another principal, have their own buckets
+    assert client.post("/tasks").status_code == 200
+    other = TestClient(app, client=("10.0.0.2", 50000)).post("/items/1")
+    assert other.status_code == 200
+
+    # Made-up credentials do not buy a fresh bucket
+    forged = client.post("/items/1", headers={"Authorization": "Bearer made-up"})
+    assert forged.status_code == 429
+{%- if cookiecutter.include_auth == "yes" %}
+
+
+def test_dependency_limits_verified_users_by_subject() -> None:
+    """Test a valid access token is limited on its subject, wherever it comes from."""
+    app = limited_app(RateLimiter(local=LocalTokenBuckets(max_keys=10)))
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token('42')}"}
+
+    # The address's bucket being empty does not limit the user
+    assert client.post("/items/1").status_code == 200
+    assert client.post("/items/1").status_code == 200
+    assert client.post("/items/1", headers=headers).status_code == 200
+    assert client.post("/items/1", headers=headers).status_code == 200
+
+    # ...but the user's bucket is shared across addresses
+    elsewhere = TestClient(app, client=("10.0.0.2", 50000))
+    assert elsewhere.post("/items/1", headers=headers).status_code == 429
+{%- endif %}
+{% if cookiecutter.use_redis == "yes" %}
+
+class FlakyRedisBuckets:
+    """Stands in for the Redis buckets, failing, stalling or answering on demand."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = True
+        self.delay = 0.0
+
+    async def hit(self, key: str, limit: int, period: float) -> Decision:
+        self.calls += 1
+        if self.fail:
+            raise redis.ConnectionError("Redis is down")
+        await asyncio.sleep(self.delay)
+        return Decision(allowed=False, remaining=0, retry_after=1)
+
+
+async def test_falls_back_to_local_buckets_when_redis_fails() -> None:
+    """Test a Redis failure switches to local limiting without retrying Redis every call."""
+    remote = FlakyRedisBuckets()
+    limiter = RateLimiter(
+        local=LocalTokenBuckets(max_keys=10),
+        remote=remote,  # type: ignore[arg-type]
+        fallback=60,
+    )
+
+    assert (await limiter.hit("client", limit=5, period=60)).allowed
+    assert (await limiter.hit("client", limit=5, period=60)).allowed
+    assert remote.calls == 1
+
+    # Once the fallback period is over Redis is asked again
+    remote.fail = False
+    limiter.degraded_until = 0
+    assert not (await limiter.hit("client", limit=5, period=60)).allowed
+    assert remote.calls == 2
+
+
+async def test_falls_back_to_local_buckets_when_redis_stalls() -> None:
+    """Test a Redis call is abandoned after the budget, and the local buckets answer."""
+    remote = FlakyRedisBuckets()
+    remote.fail = False
+    remote.delay = 1
+    limiter = RateLimiter(
+        local=LocalTokenBuckets(max_keys=10),
+        remote=remote,  # type: ignore[arg-type]
+        budget=0.01,
+        fallback=60,
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    assert (await limiter.hit("client", limit=5, period=60)).allowed
+    assert loop.time() - started < 0.5
+    assert (await limiter.hit("client", limit=5, period=60)).allowed
+    assert remote.calls == 1
+{% endif -%}
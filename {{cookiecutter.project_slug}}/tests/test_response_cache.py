@@ -0,0 +1,125 @@
+"""Unit tests for the in-process response cache."""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from app.middleware.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    ResponseCacheMiddleware,
+    cache_response,
+    invalidates_cache,
+)
+
+cache = ResponseCache(max_entries=8, max_bytes=1024)
+app = FastAPI()
+app.add_middleware(ResponseCacheMiddleware, cache=cache)
+counter = {"calls": 0}
+
+
+@app.get("/items")
+@cache_response(ttl=60, tags=("items",))
+async def list_items(page: int = 1, size: int = 10) -> dict[str, int]:
+    """Count how often the route actually runs."""
+    counter["calls"] += 1
+    return {"page": page, "size": size, "calls": counter["calls"]}
+
+
+@app.get("/uncached")
+async def uncached() -> dict[str, int]:
+    """A route without @cache_response."""
+    counter["calls"] += 1
+    return {"calls": counter["calls"]}
+
+
+@app.post("/items")
+@invalidates_cache("items")
+async def create_item() -> dict[str, bool]:
+    """A write dropping the cached item responses."""
+    return {"created": True}
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> None:
+    """Start every test from an empty cache."""
+    cache.clear()
+
+
+def entry(body: bytes, ttl: float = 60) -> CachedResponse:
+    """Build a cache entry."""
+    return CachedResponse(200, [], body, time.monotonic() + ttl, frozenset())
+
+
+def test_serves_hits_keyed_on_normalised_query() -> None:
+    """Test a repeated request, with reordered query parameters, is a hit."""
+    first = client.get("/items?page=2&size=5")
+    second = client.get("/items?size=5&page=2")
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+
+
+def test_keys_on_credentials_and_accept() -> None:
+    """Test different callers and representations are cached separately."""
+    client.get("/items")
+    assert client.get("/items", headers={"Authorization": "Bearer other"}).headers["x-cache"] == "MISS"
+    assert client.get("/items", headers={"Accept": "application/msgpack"}).headers["x-cache"] == "MISS"
+
+
+def test_keys_on_origin_so_cors_headers_match_the_caller() -> None:
+    """Test a response cached for one origin is not replayed to another."""
+    origins = ["https://a.example", "https://b.example"]
+    cors_app = FastAPI()
+    # Registered first, so CORS runs inside the cache as in app.main
+    cors_app.add_middleware(CORSMiddleware, allow_origins=origins)
+    cors_app.add_middleware(ResponseCacheMiddleware, cache=cache)
+    cors_app.get("/items")(list_items)
+    cors_client = TestClient(cors_app)
+
+    for origin in origins:
+        response = cors_client.get("/items", headers={"Origin": origin})
+        assert response.headers["x-cache"] == "MISS"
+        assert response.headers["access-control-allow-origin"] == origin
+    response = cors_client.get("/items", headers={"Origin": origins[0]})
+    assert response.headers["x-cache"] == "HIT"
+    assert response.headers["access-control-allow-origin"] == origins[0]
+
+
+def test_bypasses_conditional_requests_and_uncached_routes() -> None:
+    """Test conditional requests and undecorated routes always reach the route."""
+    client.get("/items")
+    assert "x-cache" not in client.get("/items", headers={"If-None-Match": '"x"'}).headers
+    assert "x-cache" not in client.get("/uncached").headers
+
+
+def test_writes_invalidate_tagged_entries() -> None:
+    """Test a successful write drops the cached responses of its tags."""
+    client.get("/items")
+    hits = cache.hits
+    client.post("/items")
+    assert client.get("/items").headers["x-cache"] == "MISS"
+    assert cache.hits == hits
+
+
+def test_lru_bounds_and_expiry() -> None:
+    """Test eviction by entry count and size, and expiry by TTL."""
+    small = ResponseCache(max_entries=2, max_bytes=10)
+    small.set("a", entry(b"1234"))
+    small.set("b", entry(b"1234"))
+    small.get("a")
+    small.set("c", entry(b"1234"))
+    assert small.get("b") is None
+    assert small.get("a") is not None
+    small.set("d", entry(b"12345678"))
+    assert small.stats()["entries"] == 1
+    assert small.stats()["evictions"] == 3
+
+    small.set("e", entry(b"1", ttl=-1))
+    assert small.get("e") is None
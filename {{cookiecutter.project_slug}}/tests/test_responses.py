@@ -0,0 +1,68 @@
+"""Unit tests for fast-path response serialization."""
+
+import json
+from typing import Any, NamedTuple
+
+from fastapi import FastAPI
+
+from app.api.responses import (
+    NegotiatedResponse,
+    columnar_items,
+    trusted_item,
+    trusted_items,
+    trusted_response,
+)
+from app.schemas.example import ExampleResponse
+from app.schemas.pagination import PaginatedResponse
+
+
+class FakeRow(NamedTuple):
+    """Stand-in for a SQLAlchemy Row (a named tuple with ``_fields``)."""
+
+    id: int
+    name: str
+    description: str | None
+    total: int
+
+
+ROWS = [FakeRow(i, f"Example {i}", "d" if i % 2 else None, 3) for i in range(3)]
+
+
+def test_trusted_items_project_model_fields() -> None:
+    """Test rows are projected onto the schema's fields, dropping extra columns."""
+    assert trusted_item(ExampleResponse, ROWS[1]) == {"name": "Example 1", "description": "d", "id": 1}
+    assert trusted_items(ExampleResponse, []) == []
+
+
+def test_trusted_response_matches_validated_output() -> None:
+    """Test the fast path serializes like the validating path."""
+    metadata: dict[str, Any] = {"total": 3, "page": 1, "size": 10, "pages": 1, "total_mode": "exact"}
+    validated = PaginatedResponse[ExampleResponse](items=ROWS, **metadata)
+
+    response = trusted_response({"items": trusted_items(ExampleResponse, ROWS), **metadata})
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == validated.model_dump(mode="json")
+
+
+def test_columnar_items_pivot_rows() -> None:
+    """Test rows are pivoted into one array per response field."""
+    assert columnar_items(ExampleResponse, ROWS) == {
+        "columns": ["name", "description", "id"],
+        "data": {
+            "name": ["Example 0", "Example 1", "Example 2"],
+            "description": [None, "d", None],
+            "id": [0, 1, 2],
+        },
+    }
+    assert columnar_items(ExampleResponse, [])["data"] == {"name": [], "description": [], "id": []}
+
+
+def test_negotiated_response_keeps_openapi_working() -> None:
+    """Test routes using NegotiatedResponse by default still get an OpenAPI document."""
+    app = FastAPI(default_response_class=NegotiatedResponse)
+
+    @app.get("/items")
+    async def items() -> list[int]:
+        return [1]
+
+    assert "200" in app.openapi()["paths"]["/items"]["get"]["responses"]
@@ -0,0 +1,45 @@
+"""Unit tests for the production server launcher."""
+
+from pathlib import Path
+
+import pytest
+
+from app.core import server
+from app.core.config import settings
+
+
+def test_cgroup_v2_quota(tmp_path: Path) -> None:
+    """Test the cgroup v2 cpu.max quota is read as a number of CPUs."""
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+    assert server.cgroup_cpu_limit(tmp_path) == 1.5
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert server.cgroup_cpu_limit(tmp_path) is None
+
+
+def test_cgroup_v1_quota(tmp_path: Path) -> None:
+    """Test the cgroup v1 CFS quota is used when there is no cpu.max."""
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    assert server.cgroup_cpu_limit(tmp_path) == 2
+
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("-1\n")
+    assert server.cgroup_cpu_limit(tmp_path) is None
+
+
+def test_no_cgroup(tmp_path: Path) -> None:
+    """Test a missing cgroup filesystem means no limit."""
+    assert server.cgroup_cpu_limit(tmp_path) is None
+
+
+def test_workers_capped_by_quota(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the worker count follows the CPU quota, rounded up, unless configured."""
+    monkeypatch.setattr(server, "cgroup_cpu_limit", lambda: 0.5)
+    assert server.available_cpus() == 1
+
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 3)
+    options = server.gunicorn_options()
+    assert options["workers"] == 3
+    assert options["preload_app"] is True
+    assert options["worker_class"] == "app.core.server.Worker"
@@ -0,0 +1,75 @@
+"""Unit tests for single-flight call coalescing."""
+
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_run() -> None:
+    """Test identical concurrent calls run once and all get the result."""
+    flight = SingleFlight()
+    runs = 0
+
+    async def lookup() -> int:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(flight.do("key", lookup) for _ in range(10)))
+    assert results == [42] * 10
+    assert runs == 1
+    assert (flight.runs, flight.shared) == (1, 9)
+
+    # Finished calls are not cached
+    assert await flight.do("key", lookup) == 42
+    assert runs == 2
+
+
+async def test_different_keys_run_separately() -> None:
+    """Test calls for different keys do not wait on each other."""
+    flight = SingleFlight()
+
+    async def lookup(value: int) -> int:
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(flight.do(1, lambda: lookup(1)), flight.do(2, lambda: lookup(2)))
+    assert results == [1, 2]
+    assert flight.runs == 2
+
+
+async def test_errors_reach_every_caller() -> None:
+    """Test an exception from the shared run is raised in all callers."""
+    flight = SingleFlight()
+
+    async def failing() -> None:
+        await asyncio.sleep(0.01)
+        raise LookupError("boom")
+
+    calls = (flight.do("key", failing) for _ in range(3))
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    assert all(isinstance(result, LookupError) for result in results)
+
+
+async def test_waiters_take_over_when_the_leader_is_cancelled() -> None:
+    """Test cancelling the caller running the lookup does not fail the others."""
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow() -> str:
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("key", slow))
+    await started.wait()
+    waiter = asyncio.create_task(flight.do("key", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
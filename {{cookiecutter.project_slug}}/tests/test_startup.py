@@ -0,0 +1,16 @@
+"""Start-up tests: heavy dependencies stay out of the application import."""
+
+import subprocess
+import sys
+
+LAZY_MODULES = ("celery", "jose", "passlib", "pyarrow")
+
+
+def test_app_import_skips_lazy_dependencies() -> None:
+    """Test importing the application does not load Celery, python-jose, passlib or pyarrow."""
+    code = (
+        "import sys, app.main; "
+        f"print(','.join(name for name in {LAZY_MODULES!r} if name in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
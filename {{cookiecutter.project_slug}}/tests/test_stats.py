@@ -0,0 +1,36 @@
+"""Unit tests for the per-worker stats endpoints."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import stats
+{%- if cookiecutter.include_auth == "yes" %}
+from app.core.security import create_access_token
+{%- endif %}
+from app.main import app as main_app
+from app.middleware.admission import route_priority
+
+app = FastAPI()
+app.include_router(stats.router)
+client = TestClient(app)
+
+
+def test_stats_are_not_mounted_by_default() -> None:
+    """Test the application does not expose its internals unless enabled."""
+    assert TestClient(main_app).get("/stats/cache").status_code == 404
+
+
+def test_stats_are_not_critical() -> None:
+    """Test admission control queues and sheds stats requests like any other."""
+    assert route_priority("/stats/admission") == "normal"
+
+
+def test_stats_report_counters() -> None:
+    """Test each endpoint answers with this worker's counters."""
+    {% if cookiecutter.include_auth == "yes" -%}
+    assert client.get("/stats/cache").status_code == 401
+    client.headers["Authorization"] = f"Bearer {create_access_token('42')}"
+    {% endif -%}
+    assert "hits" in client.get("/stats/cache").json()
+    assert "in_flight" in client.get("/stats/admission").json()
+    assert client.get("/stats/warmup").json() == {}